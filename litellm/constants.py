@@ -52,6 +52,7 @@ MIN_NON_ZERO_TEMPERATURE = 0.0001
 #### RELIABILITY ####
 REPEATED_STREAMING_CHUNK_LIMIT = 100  # catch if model starts looping the same chunk while streaming. Uses high default to prevent false positives.
 DEFAULT_MAX_LRU_CACHE_SIZE = 16
+MAP_FINISH_REASON_CACHE_SIZE = 256  # distinct finish reasons seen across all providers
 INITIAL_RETRY_DELAY = 0.5
 MAX_RETRY_DELAY = 8.0
 JITTER = 0.75
@@ -526,3 +527,9 @@ MAX_TEAM_LIST_LIMIT = 20
 DEFAULT_PROMPT_INJECTION_SIMILARITY_THRESHOLD = 0.7
 LENGTH_OF_LITELLM_GENERATED_KEY = 16
 SECRET_MANAGER_REFRESH_INTERVAL = 86400
+VERTEX_ACCESS_TOKEN_REFRESH_BUFFER_SECONDS = (
+    300  # refresh cached vertex access tokens in the background 5 minutes before expiry
+)
+VERTEX_ACCESS_TOKEN_MIN_REMAINING_SECONDS = (
+    60  # below this, cached vertex access tokens are refreshed before being returned
+)
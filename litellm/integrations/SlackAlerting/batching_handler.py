@@ -9,6 +9,7 @@ see custom_batch_logger.py for more details / defaults
 from typing import TYPE_CHECKING, Any
 
 from litellm._logging import verbose_proxy_logger
+from litellm.types.integrations.slack_alerting import AlertType
 
 if TYPE_CHECKING:
     from .slack_alerting import SlackAlerting as _SlackAlerting
@@ -33,13 +34,34 @@ def squash_payloads(queue):
         if _key in squashed:
             squashed[_key]["count"] += 1
             # Merge the payloads
-
+            if alert_type == AlertType.budget_alerts:
+                _merge_budget_alert_text(squashed[_key], item)
+        elif alert_type == AlertType.budget_alerts:
+            # copy - the merged text must not leak into the queued payload
+            payload = dict(item.get("payload", {}))
+            squashed[_key] = {
+                "item": {**item, "payload": payload},
+                "count": 1,
+                "texts": {payload.get("text")},
+            }
         else:
             squashed[_key] = {"item": item, "count": 1}
 
     return squashed
 
 
+def _merge_budget_alert_text(squashed_entry: dict, item: dict) -> None:
+    """
+    Budget alerts in one batch are usually about different keys / users / teams - join their text into the squashed alert instead of dropping it
+    """
+    text = item.get("payload", {}).get("text")
+    if not text or text in squashed_entry["texts"]:
+        return
+    squashed_entry["texts"].add(text)
+    payload = squashed_entry["item"]["payload"]
+    payload["text"] = f"{payload.get('text', '')}\n\n{text}"
+
+
 def _print_alerting_payload_warning(
     payload: dict, slackAlertingInstance: SlackAlertingType
 ):
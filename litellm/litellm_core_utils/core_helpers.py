@@ -1,10 +1,12 @@
 # What is this?
 ## Helper utilities
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, List, Optional, Union
 
 import httpx
 
 from litellm._logging import verbose_logger
+from litellm.constants import MAP_FINISH_REASON_CACHE_SIZE
 from litellm.types.llms.openai import AllMessageValues
 
 if TYPE_CHECKING:
@@ -17,6 +19,22 @@ else:
 
 def map_finish_reason(
     finish_reason: str,
+):
+    try:
+        return _cached_map_finish_reason(finish_reason)
+    except TypeError:  # unhashable value - not cacheable, map it directly
+        return _map_finish_reason(finish_reason)
+
+
+# pure function over a small set of provider values. typed=True, so e.g. a str enum
+# member isn't answered with the cached plain-str result (or vice versa)
+@lru_cache(maxsize=MAP_FINISH_REASON_CACHE_SIZE, typed=True)
+def _cached_map_finish_reason(finish_reason: str):
+    return _map_finish_reason(finish_reason)
+
+
+def _map_finish_reason(
+    finish_reason: str,
 ):  # openai supports 5 stop sequences - 'stop', 'length', 'function_call', 'content_filter', 'null'
     # anthropic mapping
     if finish_reason == "stop_sequence":
@@ -1,22 +1,55 @@
 """Utils for accessing credentials."""
 
-from typing import List
+from typing import Dict, List, Optional
 
 import litellm
 from litellm.types.utils import CredentialItem
 
+# credential_name -> position in `litellm.credential_list`, built lazily.
+# `_indexed_list` holds the list the index was built from, so replacing
+# `litellm.credential_list` (or growing / shrinking it) triggers a rebuild.
+_credential_index: Dict[str, int] = {}
+_indexed_list: Optional[List[CredentialItem]] = None
+_indexed_list_len: int = -1
+
+
+def _invalidate_credential_index():
+    global _indexed_list
+    _indexed_list = None
+
+
+def _get_credential_index(credential_list: List[CredentialItem]) -> Dict[str, int]:
+    global _credential_index, _indexed_list, _indexed_list_len
+    if (
+        credential_list is not _indexed_list
+        or len(credential_list) != _indexed_list_len
+    ):
+        index: Dict[str, int] = {}
+        for i, credential in enumerate(credential_list):
+            index.setdefault(credential.credential_name, i)  # first match wins
+        _credential_index = index
+        _indexed_list = credential_list
+        _indexed_list_len = len(credential_list)
+    return _credential_index
+
 
 class CredentialAccessor:
     @staticmethod
     def get_credential_values(credential_name: str) -> dict:
         """Safe accessor for credentials."""
 
-        if not litellm.credential_list:
+        credential_list = litellm.credential_list
+        if not credential_list:
+            return {}
+        i = _get_credential_index(credential_list).get(credential_name)
+        if i is None or credential_list[i].credential_name != credential_name:
+            # miss or stale hit - the list may have been edited in place, so
+            # rebuild and retry once (same cost as the old linear scan)
+            _invalidate_credential_index()
+            i = _get_credential_index(credential_list).get(credential_name)
+        if i is None:
             return {}
-        for credential in litellm.credential_list:
-            if credential.credential_name == credential_name:
-                return credential.credential_values.copy()
-        return {}
+        return credential_list[i].credential_values.copy()
 
     @staticmethod
     def upsert_credentials(credentials: List[CredentialItem]):
@@ -33,3 +66,4 @@ class CredentialAccessor:
                         break
             else:
                 litellm.credential_list.append(credential)
+        _invalidate_credential_index()
@@ -0,0 +1,55 @@
+"""
+JSON helpers that use `orjson` when it is installed.
+
+`orjson` ships with `litellm[proxy]`, but is optional for SDK users - so every helper here falls back to the stdlib `json` module.
+"""
+
+import json
+from typing import Any, Union
+
+import httpx
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None  # type: ignore
+
+
+def fast_json_loads(data: Union[str, bytes, bytearray]) -> Any:
+    """
+    Parse a JSON document, using orjson if available.
+
+    Anything orjson rejects (e.g. NaN / Infinity, non utf-8 bytes) is re-parsed with the stdlib, so the result and raised errors match `json.loads`.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except (orjson.JSONDecodeError, TypeError):
+            pass
+    return json.loads(data)
+
+
+def fast_response_json(response: httpx.Response) -> Any:
+    """
+    Drop-in replacement for `response.json()` that parses the raw body bytes with `fast_json_loads`.
+    """
+    content = response.content
+    if isinstance(content, (bytes, bytearray)):
+        return fast_json_loads(content)
+    return response.json()
+
+
+def fast_json_dumps_sorted(data: Any) -> bytes:
+    """
+    Serialize `data` to compact, key-sorted utf-8 JSON, using orjson if available.
+
+    Meant for building cache keys / hashes - the output spacing differs from `json.dumps`, so don't use it for request bodies.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+        except TypeError:  # orjson.JSONEncodeError subclasses TypeError
+            pass
+    return json.dumps(
+        data, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
@@ -4,9 +4,10 @@ Calling + translation logic for anthropic's `/v1/messages` endpoint
 
 import copy
 import json
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple, Union, cast
 
 import httpx  # type: ignore
+from typing_extensions import TypedDict
 
 import litellm
 import litellm.litellm_core_utils
@@ -14,6 +15,7 @@ import litellm.types
 import litellm.types.utils
 from litellm import LlmProviders
 from litellm.litellm_core_utils.core_helpers import map_finish_reason
+from litellm.litellm_core_utils.fast_json import fast_json_loads
 from litellm.llms.base_llm.chat.transformation import BaseConfig
 from litellm.llms.custom_httpx.http_handler import (
     AsyncHTTPHandler,
@@ -21,9 +23,7 @@ from litellm.llms.custom_httpx.http_handler import (
     get_async_httpx_client,
 )
 from litellm.types.llms.anthropic import (
-    ContentBlockDelta,
     ContentBlockStart,
-    ContentBlockStop,
     MessageBlockDelta,
     MessageStartBlock,
     UsageDelta,
@@ -453,59 +453,94 @@ class AnthropicChatCompletion(BaseLLM):
         pass
 
 
+# shared reply for non-`data:` SSE lines (event names, pings) - consumers only read it
+_EMPTY_GENERIC_CHUNK = GenericStreamingChunk(
+    text="",
+    is_finished=False,
+    finish_reason="",
+    usage=None,
+    index=0,
+    tool_use=None,
+)
+
+
+class _ParsedChunkFields(TypedDict, total=False):
+    """
+    Delta fields parsed from one anthropic stream chunk - missing keys use empty defaults
+    """
+
+    text: str
+    tool_use: Optional[ChatCompletionToolCallChunk]
+    finish_reason: str
+    usage: Usage
+    provider_specific_fields: Dict[str, Any]
+    reasoning_content: Optional[str]
+    thinking_blocks: List[ChatCompletionThinkingBlock]
+
+
 class ModelResponseIterator:
+    # one instance per stream, and its attributes are read on every chunk
+    __slots__ = (
+        "streaming_response",
+        "response_iterator",
+        "async_response_iterator",
+        "tool_index",
+        "json_mode",
+        "_block_first_delta_type",
+        "_block_tool_args_len",
+    )
+
+    # chunk `type` -> name of the method that parses it
+    _CHUNK_HANDLERS: ClassVar[Dict[str, str]] = {
+        "content_block_delta": "_parse_content_block_delta",
+        "content_block_start": "_parse_content_block_start",
+        "content_block_stop": "_parse_content_block_stop",
+        "message_delta": "_parse_message_delta",
+        "message_start": "_parse_message_start",
+        "error": "_parse_error",
+    }
+
     def __init__(
         self, streaming_response, sync_stream: bool, json_mode: Optional[bool] = False
     ):
         self.streaming_response = streaming_response
         self.response_iterator = self.streaming_response
-        self.content_blocks: List[ContentBlockDelta] = []
         self.tool_index = -1
         self.json_mode = json_mode
+        # state of the current content block, reset on `content_block_start`
+        self._block_first_delta_type: Optional[str] = None
+        self._block_tool_args_len = 0
 
     def check_empty_tool_call_args(self) -> bool:
         """
         Check if the tool call block so far has been an empty string
         """
-        args = ""
-        # if text content block -> skip
-        if len(self.content_blocks) == 0:
-            return False
-
-        if (
-            self.content_blocks[0]["delta"]["type"] == "text_delta"
-            or self.content_blocks[0]["delta"]["type"] == "thinking_delta"
+        # no deltas yet, or a text / thinking content block -> skip
+        if self._block_first_delta_type is None or self._block_first_delta_type in (
+            "text_delta",
+            "thinking_delta",
         ):
             return False
 
-        for block in self.content_blocks:
-            if block["delta"]["type"] == "input_json_delta":
-                args += block["delta"].get("partial_json", "")  # type: ignore
-
-        if len(args) == 0:
-            return True
-        return False
+        return self._block_tool_args_len == 0
 
     def _handle_usage(self, anthropic_usage_chunk: Union[dict, UsageDelta]) -> Usage:
+        input_tokens = anthropic_usage_chunk.get("input_tokens", 0)
+        output_tokens = anthropic_usage_chunk.get("output_tokens", 0)
         usage_block = Usage(
-            prompt_tokens=anthropic_usage_chunk.get("input_tokens", 0),
-            completion_tokens=anthropic_usage_chunk.get("output_tokens", 0),
-            total_tokens=anthropic_usage_chunk.get("input_tokens", 0)
-            + anthropic_usage_chunk.get("output_tokens", 0),
+            prompt_tokens=input_tokens,
+            completion_tokens=output_tokens,
+            total_tokens=input_tokens + output_tokens,
         )
 
         cache_creation_input_tokens = anthropic_usage_chunk.get(
             "cache_creation_input_tokens"
         )
-        if cache_creation_input_tokens is not None and isinstance(
-            cache_creation_input_tokens, int
-        ):
+        if isinstance(cache_creation_input_tokens, int):
             usage_block["cache_creation_input_tokens"] = cache_creation_input_tokens
 
         cache_read_input_tokens = anthropic_usage_chunk.get("cache_read_input_tokens")
-        if cache_read_input_tokens is not None and isinstance(
-            cache_read_input_tokens, int
-        ):
+        if isinstance(cache_read_input_tokens, int):
             usage_block["cache_read_input_tokens"] = cache_read_input_tokens
 
         return usage_block
@@ -525,33 +560,35 @@ class ModelResponseIterator:
         text = ""
         tool_use: Optional[ChatCompletionToolCallChunk] = None
         provider_specific_fields = {}
-        content_block = ContentBlockDelta(**chunk)  # type: ignore
         thinking_blocks: List[ChatCompletionThinkingBlock] = []
 
-        self.content_blocks.append(content_block)
-        if "text" in content_block["delta"]:
-            text = content_block["delta"]["text"]
-        elif "partial_json" in content_block["delta"]:
+        delta = chunk["delta"]
+        delta_type = delta.get("type")
+        if self._block_first_delta_type is None:
+            self._block_first_delta_type = delta_type
+        if delta_type == "input_json_delta":
+            self._block_tool_args_len += len(delta.get("partial_json", ""))
+
+        if "text" in delta:
+            text = delta["text"]
+        elif "partial_json" in delta:
             tool_use = {
                 "id": None,
                 "type": "function",
                 "function": {
                     "name": None,
-                    "arguments": content_block["delta"]["partial_json"],
+                    "arguments": delta["partial_json"],
                 },
                 "index": self.tool_index,
             }
-        elif "citation" in content_block["delta"]:
-            provider_specific_fields["citation"] = content_block["delta"]["citation"]
-        elif (
-            "thinking" in content_block["delta"]
-            or "signature" in content_block["delta"]
-        ):
+        elif "citation" in delta:
+            provider_specific_fields["citation"] = delta["citation"]
+        elif "thinking" in delta or "signature" in delta:
             thinking_blocks = [
                 ChatCompletionThinkingBlock(
                     type="thinking",
-                    thinking=content_block["delta"].get("thinking") or "",
-                    signature=content_block["delta"].get("signature"),
+                    thinking=delta.get("thinking") or "",
+                    signature=delta.get("signature"),
                 )
             ]
             provider_specific_fields["thinking_blocks"] = thinking_blocks
@@ -571,146 +608,156 @@ class ModelResponseIterator:
                 reasoning_content += block["thinking"]
         return reasoning_content
 
-    def chunk_parser(self, chunk: dict) -> ModelResponseStream:
-        try:
-            type_chunk = chunk.get("type", "") or ""
-
-            text = ""
-            tool_use: Optional[ChatCompletionToolCallChunk] = None
-            finish_reason = ""
-            usage: Optional[Usage] = None
-            provider_specific_fields: Dict[str, Any] = {}
-            reasoning_content: Optional[str] = None
-            thinking_blocks: Optional[List[ChatCompletionThinkingBlock]] = None
-
-            index = int(chunk.get("index", 0))
-            if type_chunk == "content_block_delta":
-                """
-                Anthropic content chunk
-                chunk = {'type': 'content_block_delta', 'index': 0, 'delta': {'type': 'text_delta', 'text': 'Hello'}}
-                """
-                (
-                    text,
-                    tool_use,
-                    thinking_blocks,
-                    provider_specific_fields,
-                ) = self._content_block_delta_helper(chunk=chunk)
-                if thinking_blocks:
-                    reasoning_content = self._handle_reasoning_content(
-                        thinking_blocks=thinking_blocks
-                    )
-            elif type_chunk == "content_block_start":
-                """
-                event: content_block_start
-                data: {"type":"content_block_start","index":1,"content_block":{"type":"tool_use","id":"toolu_01T1x1fJ34qAmk2tNTrN7Up6","name":"get_weather","input":{}}}
-                """
-                content_block_start = ContentBlockStart(**chunk)  # type: ignore
-                self.content_blocks = []  # reset content blocks when new block starts
-                if content_block_start["content_block"]["type"] == "text":
-                    text = content_block_start["content_block"]["text"]
-                elif content_block_start["content_block"]["type"] == "tool_use":
-                    self.tool_index += 1
-                    tool_use = {
-                        "id": content_block_start["content_block"]["id"],
-                        "type": "function",
-                        "function": {
-                            "name": content_block_start["content_block"]["name"],
-                            "arguments": "",
-                        },
-                        "index": self.tool_index,
-                    }
-            elif type_chunk == "content_block_stop":
-                ContentBlockStop(**chunk)  # type: ignore
-                # check if tool call content block
-                is_empty = self.check_empty_tool_call_args()
-
-                if is_empty:
-                    tool_use = {
-                        "id": None,
-                        "type": "function",
-                        "function": {
-                            "name": None,
-                            "arguments": "{}",
-                        },
-                        "index": self.tool_index,
-                    }
-            elif type_chunk == "message_delta":
-                """
-                Anthropic
-                chunk = {'type': 'message_delta', 'delta': {'stop_reason': 'max_tokens', 'stop_sequence': None}, 'usage': {'output_tokens': 10}}
-                """
-                # TODO - get usage from this chunk, set in response
-                message_delta = MessageBlockDelta(**chunk)  # type: ignore
-                finish_reason = map_finish_reason(
-                    finish_reason=message_delta["delta"].get("stop_reason", "stop")
-                    or "stop"
-                )
-                usage = self._handle_usage(anthropic_usage_chunk=message_delta["usage"])
-            elif type_chunk == "message_start":
-                """
-                Anthropic
-                chunk = {
-                    "type": "message_start",
-                    "message": {
-                        "id": "msg_vrtx_011PqREFEMzd3REdCoUFAmdG",
-                        "type": "message",
-                        "role": "assistant",
-                        "model": "claude-3-sonnet-20240229",
-                        "content": [],
-                        "stop_reason": null,
-                        "stop_sequence": null,
-                        "usage": {
-                            "input_tokens": 270,
-                            "output_tokens": 1
-                        }
-                    }
+    def _parse_content_block_delta(self, chunk: dict) -> _ParsedChunkFields:
+        """
+        Anthropic content chunk
+        chunk = {'type': 'content_block_delta', 'index': 0, 'delta': {'type': 'text_delta', 'text': 'Hello'}}
+        """
+        (
+            text,
+            tool_use,
+            thinking_blocks,
+            provider_specific_fields,
+        ) = self._content_block_delta_helper(chunk=chunk)
+        parsed: _ParsedChunkFields = {
+            "text": text,
+            "tool_use": tool_use,
+            "provider_specific_fields": provider_specific_fields,
+        }
+        if thinking_blocks:
+            parsed["thinking_blocks"] = thinking_blocks
+            parsed["reasoning_content"] = self._handle_reasoning_content(
+                thinking_blocks=thinking_blocks
+            )
+        return parsed
+
+    def _parse_content_block_start(self, chunk: dict) -> _ParsedChunkFields:
+        """
+        event: content_block_start
+        data: {"type":"content_block_start","index":1,"content_block":{"type":"tool_use","id":"toolu_01T1x1fJ34qAmk2tNTrN7Up6","name":"get_weather","input":{}}}
+        """
+        content_block_start = cast(ContentBlockStart, chunk)
+        # reset content block state when new block starts
+        self._block_first_delta_type = None
+        self._block_tool_args_len = 0
+        if content_block_start["content_block"]["type"] == "text":
+            return {"text": content_block_start["content_block"]["text"]}
+        elif content_block_start["content_block"]["type"] == "tool_use":
+            self.tool_index += 1
+            return {
+                "tool_use": {
+                    "id": content_block_start["content_block"]["id"],
+                    "type": "function",
+                    "function": {
+                        "name": content_block_start["content_block"]["name"],
+                        "arguments": "",
+                    },
+                    "index": self.tool_index,
                 }
-                """
-                message_start_block = MessageStartBlock(**chunk)  # type: ignore
-                if "usage" in message_start_block["message"]:
-                    usage = self._handle_usage(
-                        anthropic_usage_chunk=message_start_block["message"]["usage"]
-                    )
-            elif type_chunk == "error":
-                """
-                {"type":"error","error":{"details":null,"type":"api_error","message":"Internal server error"}      }
-                """
-                _error_dict = chunk.get("error", {}) or {}
-                message = _error_dict.get("message", None) or str(chunk)
-                raise AnthropicError(
-                    message=message,
-                    status_code=500,  # it looks like Anthropic API does not return a status code in the chunk error - default to 500
+            }
+        return {}
+
+    def _parse_content_block_stop(self, chunk: dict) -> _ParsedChunkFields:
+        # check if tool call content block
+        if self.check_empty_tool_call_args():
+            return {
+                "tool_use": {
+                    "id": None,
+                    "type": "function",
+                    "function": {
+                        "name": None,
+                        "arguments": "{}",
+                    },
+                    "index": self.tool_index,
+                }
+            }
+        return {}
+
+    def _parse_message_delta(self, chunk: dict) -> _ParsedChunkFields:
+        """
+        Anthropic
+        chunk = {'type': 'message_delta', 'delta': {'stop_reason': 'max_tokens', 'stop_sequence': None}, 'usage': {'output_tokens': 10}}
+        """
+        message_delta = cast(MessageBlockDelta, chunk)
+        return {
+            "finish_reason": map_finish_reason(
+                finish_reason=message_delta["delta"].get("stop_reason", "stop")
+                or "stop"
+            ),
+            "usage": self._handle_usage(anthropic_usage_chunk=message_delta["usage"]),
+        }
+
+    def _parse_message_start(self, chunk: dict) -> _ParsedChunkFields:
+        """
+        Anthropic
+        chunk = {
+            "type": "message_start",
+            "message": {
+                "id": "msg_vrtx_011PqREFEMzd3REdCoUFAmdG",
+                "type": "message",
+                "role": "assistant",
+                "model": "claude-3-sonnet-20240229",
+                "content": [],
+                "stop_reason": null,
+                "stop_sequence": null,
+                "usage": {
+                    "input_tokens": 270,
+                    "output_tokens": 1
+                }
+            }
+        }
+        """
+        message_start_block = cast(MessageStartBlock, chunk)
+        if "usage" in message_start_block["message"]:
+            return {
+                "usage": self._handle_usage(
+                    anthropic_usage_chunk=message_start_block["message"]["usage"]
                 )
+            }
+        return {}
 
+    def _parse_error(self, chunk: dict) -> _ParsedChunkFields:
+        """
+        {"type":"error","error":{"details":null,"type":"api_error","message":"Internal server error"}      }
+        """
+        _error_dict = chunk.get("error", {}) or {}
+        message = _error_dict.get("message", None) or str(chunk)
+        raise AnthropicError(
+            message=message,
+            status_code=500,  # it looks like Anthropic API does not return a status code in the chunk error - default to 500
+        )
+
+    def chunk_parser(self, chunk: dict) -> ModelResponseStream:
+        handler_name = self._CHUNK_HANDLERS.get(chunk.get("type", ""))
+        parsed: _ParsedChunkFields = (
+            getattr(self, handler_name)(chunk) if handler_name is not None else {}
+        )
+
+        text = parsed.get("text", "")
+        tool_use = parsed.get("tool_use")
+        if self.json_mode is True and tool_use is not None:
             text, tool_use = self._handle_json_mode_chunk(text=text, tool_use=tool_use)
 
-            returned_chunk = ModelResponseStream(
-                choices=[
-                    StreamingChoices(
-                        index=index,
-                        delta=Delta(
-                            content=text,
-                            tool_calls=[tool_use] if tool_use is not None else None,
-                            provider_specific_fields=(
-                                provider_specific_fields
-                                if provider_specific_fields
-                                else None
-                            ),
-                            thinking_blocks=(
-                                thinking_blocks if thinking_blocks else None
-                            ),
-                            reasoning_content=reasoning_content,
+        returned_chunk = ModelResponseStream(
+            choices=[
+                StreamingChoices(
+                    index=chunk.get("index", 0),  # message_* chunks carry no index
+                    delta=Delta(
+                        content=text,
+                        tool_calls=[tool_use] if tool_use is not None else None,
+                        provider_specific_fields=(
+                            parsed.get("provider_specific_fields") or None
                         ),
-                        finish_reason=finish_reason,
-                    )
-                ],
-                usage=usage,
-            )
-
-            return returned_chunk
+                        thinking_blocks=parsed.get("thinking_blocks"),
+                        reasoning_content=parsed.get("reasoning_content"),
+                    ),
+                    finish_reason=parsed.get("finish_reason", ""),
+                )
+            ],
+            usage=parsed.get("usage"),
+        )
 
-        except json.JSONDecodeError:
-            raise ValueError(f"Failed to decode JSON from chunk: {chunk}")
+        return returned_chunk
 
     def _handle_json_mode_chunk(
         self, text: str, tool_use: Optional[ChatCompletionToolCallChunk]
@@ -740,6 +787,20 @@ class ModelResponseIterator:
 
         return text, tool_use
 
+    @staticmethod
+    def _get_sse_data(chunk: Union[str, bytes]) -> Optional[Union[str, bytes]]:
+        """
+        Return the payload of an SSE `data:` line, or None for any other line (e.g. `event:`).
+
+        Binary chunks are sliced without decoding - `fast_json_loads` accepts utf-8 bytes directly.
+        """
+        if isinstance(chunk, bytes):
+            index = chunk.find(b"data:")
+            return chunk[index + 5 :] if index != -1 else None
+        if chunk.startswith("data:"):
+            return chunk[5:]
+        return None
+
     # Sync iterator
     def __iter__(self):
         return self
@@ -753,25 +814,11 @@ class ModelResponseIterator:
             raise RuntimeError(f"Error receiving chunk from stream: {e}")
 
         try:
-            str_line = chunk
-            if isinstance(chunk, bytes):  # Handle binary data
-                str_line = chunk.decode("utf-8")  # Convert bytes to string
-                index = str_line.find("data:")
-                if index != -1:
-                    str_line = str_line[index:]
-
-            if str_line.startswith("data:"):
-                data_json = json.loads(str_line[5:])
-                return self.chunk_parser(chunk=data_json)
+            data_str = self._get_sse_data(chunk)
+            if data_str is not None:
+                return self.chunk_parser(chunk=fast_json_loads(data_str))
             else:
-                return GenericStreamingChunk(
-                    text="",
-                    is_finished=False,
-                    finish_reason="",
-                    usage=None,
-                    index=0,
-                    tool_use=None,
-                )
+                return _EMPTY_GENERIC_CHUNK
         except StopIteration:
             raise StopIteration
         except ValueError as e:
@@ -791,25 +838,11 @@ class ModelResponseIterator:
             raise RuntimeError(f"Error receiving chunk from stream: {e}")
 
         try:
-            str_line = chunk
-            if isinstance(chunk, bytes):  # Handle binary data
-                str_line = chunk.decode("utf-8")  # Convert bytes to string
-                index = str_line.find("data:")
-                if index != -1:
-                    str_line = str_line[index:]
-
-            if str_line.startswith("data:"):
-                data_json = json.loads(str_line[5:])
-                return self.chunk_parser(chunk=data_json)
+            data_str = self._get_sse_data(chunk)
+            if data_str is not None:
+                return self.chunk_parser(chunk=fast_json_loads(data_str))
             else:
-                return GenericStreamingChunk(
-                    text="",
-                    is_finished=False,
-                    finish_reason="",
-                    usage=None,
-                    index=0,
-                    tool_use=None,
-                )
+                return _EMPTY_GENERIC_CHUNK
         except StopAsyncIteration:
             raise StopAsyncIteration
         except ValueError as e:
@@ -824,15 +857,8 @@ class ModelResponseIterator:
         We can move __anext__, and __next__ to use this function since it's common logic.
         Did not migrate them to minmize changes made in 1 PR.
         """
-        str_line = chunk
-        if isinstance(chunk, bytes):  # Handle binary data
-            str_line = chunk.decode("utf-8")  # Convert bytes to string
-            index = str_line.find("data:")
-            if index != -1:
-                str_line = str_line[index:]
-
-        if str_line.startswith("data:"):
-            data_json = json.loads(str_line[5:])
-            return self.chunk_parser(chunk=data_json)
+        data_str = self._get_sse_data(chunk)
+        if data_str is not None:
+            return self.chunk_parser(chunk=fast_json_loads(data_str))
         else:
             return ModelResponseStream()
@@ -1,5 +1,6 @@
 import json
 import time
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union, cast
 
 import httpx
@@ -7,9 +8,11 @@ import httpx
 import litellm
 from litellm.constants import (
     DEFAULT_ANTHROPIC_CHAT_MAX_TOKENS,
+    DEFAULT_MAX_LRU_CACHE_SIZE,
     RESPONSE_FORMAT_TOOL_NAME,
 )
 from litellm.litellm_core_utils.core_helpers import map_finish_reason
+from litellm.litellm_core_utils.fast_json import fast_json_loads, fast_response_json
 from litellm.litellm_core_utils.prompt_templates.factory import anthropic_messages_pt
 from litellm.llms.base_llm.base_utils import type_to_response_format_param
 from litellm.llms.base_llm.chat.transformation import BaseConfig, BaseLLMException
@@ -30,7 +33,6 @@ from litellm.types.llms.openai import (
     ChatCompletionSystemMessage,
     ChatCompletionThinkingBlock,
     ChatCompletionToolCallChunk,
-    ChatCompletionToolCallFunctionChunk,
     ChatCompletionToolParam,
 )
 from litellm.types.utils import CompletionTokensDetailsWrapper
@@ -54,6 +56,124 @@ else:
     LoggingClass = Any
 
 
+# beta headers enabled by (prompt_caching_set, computer_tool_used, pdf_used)
+_ANTHROPIC_BETA_STRINGS: Tuple[str, str, str] = (
+    "prompt-caching-2024-07-31",
+    "computer-use-2024-10-22",
+    "pdfs-2024-09-25",
+)
+
+_SUPPORTED_OPENAI_PARAMS: Tuple[str, ...] = (
+    "stream",
+    "stop",
+    "temperature",
+    "top_p",
+    "max_tokens",
+    "max_completion_tokens",
+    "tools",
+    "tool_choice",
+    "extra_headers",
+    "parallel_tool_calls",
+    "response_format",
+    "user",
+    "reasoning_effort",
+)
+
+# openai params copied as-is into the anthropic request, {openai param: anthropic param}
+_DIRECT_OPENAI_PARAMS: Dict[str, str] = {
+    "max_tokens": "max_tokens",
+    "max_completion_tokens": "max_tokens",
+    "temperature": "temperature",
+    "top_p": "top_p",
+    "thinking": "thinking",
+}
+
+# openai params needing translation, {openai param: AnthropicConfig handler method}
+# kept at module level - `get_config()` would otherwise send class attributes as request params
+_OPENAI_PARAM_HANDLERS: Dict[str, str] = {
+    "tools": "_map_tools_param",
+    "tool_choice": "_map_tool_choice_param",
+    "parallel_tool_calls": "_map_tool_choice_param",
+    "stream": "_map_stream_param",
+    "stop": "_map_stop_param",
+    "response_format": "_map_response_format_param",
+    "user": "_map_user_param",
+    "reasoning_effort": "_map_reasoning_effort_param",
+}
+
+
+# {config class: (snapshot of the class __dict__, get_config() result)}
+_CONFIG_CACHE: Dict[type, Tuple[Dict[str, Any], dict]] = {}
+
+
+@lru_cache(maxsize=DEFAULT_MAX_LRU_CACHE_SIZE)
+def _get_anthropic_header_template(
+    anthropic_version: Optional[str],
+    computer_tool_used: bool,
+    prompt_caching_set: bool,
+    pdf_used: bool,
+    is_vertex_request: bool,
+    user_anthropic_beta_headers: Optional[Tuple[str, ...]],
+) -> Tuple[Tuple[str, str], ...]:
+    """
+    Build the request-independent anthropic headers (everything except `x-api-key`).
+
+    Cached - the same handful of flag combinations is seen on every request.
+    """
+    headers = {
+        "anthropic-version": anthropic_version or "2023-06-01",
+        "accept": "application/json",
+        "content-type": "application/json",
+    }
+
+    # Don't send any beta headers to Vertex, Vertex has failed requests when they are sent
+    if is_vertex_request is True:
+        return tuple(headers.items())
+
+    betas = [
+        beta
+        for beta, is_used in zip(
+            _ANTHROPIC_BETA_STRINGS, (prompt_caching_set, computer_tool_used, pdf_used)
+        )
+        if is_used
+    ]
+    if user_anthropic_beta_headers is not None:
+        betas.extend(user_anthropic_beta_headers)
+
+    beta_header = ",".join(dict.fromkeys(betas))  # de-duplicate, keep order
+    if beta_header:
+        headers["anthropic-beta"] = beta_header
+
+    return tuple(headers.items())
+
+
+def _get_beta_flags_index(
+    prompt_caching_set: bool, computer_tool_used: bool, pdf_used: bool
+) -> int:
+    """Pack the beta flags into a 3-bit index into `_DEFAULT_ANTHROPIC_HEADERS`."""
+    return (
+        (bool(prompt_caching_set) << 2)
+        | (bool(computer_tool_used) << 1)
+        | bool(pdf_used)
+    )
+
+
+# headers for requests without version / beta overrides, indexed by `_get_beta_flags_index`
+_DEFAULT_ANTHROPIC_HEADERS: Tuple[Dict[str, str], ...] = tuple(
+    dict(
+        _get_anthropic_header_template(
+            anthropic_version=None,
+            computer_tool_used=bool(flags_index & 2),
+            prompt_caching_set=bool(flags_index & 4),
+            pdf_used=bool(flags_index & 1),
+            is_vertex_request=False,
+            user_anthropic_beta_headers=None,
+        )
+    )
+    for flags_index in range(8)
+)
+
+
 class AnthropicConfig(BaseConfig):
     """
     Reference: https://docs.anthropic.com/claude/reference/messages_post
@@ -83,31 +203,43 @@ class AnthropicConfig(BaseConfig):
         metadata: Optional[dict] = None,
         system: Optional[str] = None,
     ) -> None:
-        locals_ = locals().copy()
-        for key, value in locals_.items():
-            if key != "self" and value is not None:
-                setattr(self.__class__, key, value)
+        # values are stored on the class, so they are picked up by `get_config()` (this is how `litellm.AnthropicConfig(...)` sets global defaults)
+        config_cls = type(self)
+        if max_tokens is not None:
+            config_cls.max_tokens = max_tokens
+        if stop_sequences is not None:
+            config_cls.stop_sequences = stop_sequences
+        if temperature is not None:
+            config_cls.temperature = temperature
+        if top_p is not None:
+            config_cls.top_p = top_p
+        if top_k is not None:
+            config_cls.top_k = top_k
+        if metadata is not None:
+            config_cls.metadata = metadata
+        if system is not None:
+            config_cls.system = system
 
     @classmethod
-    def get_config(cls):
+    def get_config(cls) -> dict:
         return super().get_config()
 
-    def get_supported_openai_params(self, model: str):
-        params = [
-            "stream",
-            "stop",
-            "temperature",
-            "top_p",
-            "max_tokens",
-            "max_completion_tokens",
-            "tools",
-            "tool_choice",
-            "extra_headers",
-            "parallel_tool_calls",
-            "response_format",
-            "user",
-            "reasoning_effort",
-        ]
+    @classmethod
+    def _get_cached_config(cls) -> dict:
+        """
+        Same as `get_config()`, but only re-computed when the class attributes change.
+
+        Comparing the class __dict__ against a snapshot is a C-level dict compare, far cheaper than reflecting over the class on every request.
+        """
+        class_dict = vars(cls)
+        cached = _CONFIG_CACHE.get(cls)
+        if cached is None or cached[0] != class_dict:
+            cached = (dict(class_dict), cls.get_config())
+            _CONFIG_CACHE[cls] = cached
+        return cached[1]
+
+    def get_supported_openai_params(self, model: str) -> List[str]:
+        params = list(_SUPPORTED_OPENAI_PARAMS)  # callers may extend the list
 
         if "claude-3-7-sonnet" in model:
             params.append("thinking")
@@ -137,30 +269,31 @@ class AnthropicConfig(BaseConfig):
         is_vertex_request: bool = False,
         user_anthropic_beta_headers: Optional[List[str]] = None,
     ) -> dict:
-        betas = set()
-        if prompt_caching_set:
-            betas.add("prompt-caching-2024-07-31")
-        if computer_tool_used:
-            betas.add("computer-use-2024-10-22")
-        if pdf_used:
-            betas.add("pdfs-2024-09-25")
-        headers = {
-            "anthropic-version": anthropic_version or "2023-06-01",
-            "x-api-key": api_key,
-            "accept": "application/json",
-            "content-type": "application/json",
-        }
-
-        if user_anthropic_beta_headers is not None:
-            betas.update(user_anthropic_beta_headers)
-
-        # Don't send any beta headers to Vertex, Vertex has failed requests when they are sent
-        if is_vertex_request is True:
-            pass
-        elif len(betas) > 0:
-            headers["anthropic-beta"] = ",".join(betas)
+        if (
+            anthropic_version is None
+            and user_anthropic_beta_headers is None
+            and is_vertex_request is not True
+        ):
+            flags_index = _get_beta_flags_index(
+                prompt_caching_set=prompt_caching_set,
+                computer_tool_used=computer_tool_used,
+                pdf_used=pdf_used,
+            )
+            return {"x-api-key": api_key, **_DEFAULT_ANTHROPIC_HEADERS[flags_index]}
 
-        return headers
+        header_template = _get_anthropic_header_template(
+            anthropic_version=anthropic_version,
+            computer_tool_used=computer_tool_used,
+            prompt_caching_set=prompt_caching_set,
+            pdf_used=pdf_used,
+            is_vertex_request=is_vertex_request,
+            user_anthropic_beta_headers=(
+                tuple(user_anthropic_beta_headers)
+                if user_anthropic_beta_headers is not None
+                else None
+            ),
+        )
+        return {"x-api-key": api_key, **dict(header_template)}
 
     def _map_tool_choice(
         self, tool_choice: Optional[str], parallel_tool_use: Optional[bool]
@@ -194,72 +327,70 @@ class AnthropicConfig(BaseConfig):
         self, tool: ChatCompletionToolParam
     ) -> AllAnthropicToolsValues:
         returned_tool: Optional[AllAnthropicToolsValues] = None
+        tool_type = tool["type"]
+        fn: dict = cast(dict, tool.get("function") or {})
 
-        if tool["type"] == "function" or tool["type"] == "custom":
-            _input_schema: dict = tool["function"].get(
+        if tool_type == "function" or tool_type == "custom":
+            _input_schema: dict = fn.get(
                 "parameters",
                 {
                     "type": "object",
                     "properties": {},
                 },
             )
-            input_schema: AnthropicInputSchema = AnthropicInputSchema(**_input_schema)
-            _tool = AnthropicMessagesTool(
-                name=tool["function"]["name"],
-                input_schema=input_schema,
-            )
+            input_schema = cast(AnthropicInputSchema, dict(_input_schema))
+            _tool: AnthropicMessagesTool = {
+                "name": fn["name"],
+                "input_schema": input_schema,
+            }
 
-            _description = tool["function"].get("description")
+            _description = fn.get("description")
             if _description is not None:
                 _tool["description"] = _description
 
             returned_tool = _tool
 
-        elif tool["type"].startswith("computer_"):
+        elif tool_type.startswith("computer_"):
             ## check if all required 'display_' params are given
-            if "parameters" not in tool["function"]:
+            if "parameters" not in fn:
                 raise ValueError("Missing required parameter: parameters")
 
-            _display_width_px: Optional[int] = tool["function"]["parameters"].get(
-                "display_width_px"
-            )
-            _display_height_px: Optional[int] = tool["function"]["parameters"].get(
-                "display_height_px"
-            )
+            params: dict = fn["parameters"]
+            _display_width_px: Optional[int] = params.get("display_width_px")
+            _display_height_px: Optional[int] = params.get("display_height_px")
             if _display_width_px is None or _display_height_px is None:
                 raise ValueError(
                     "Missing required parameter: display_width_px or display_height_px"
                 )
 
-            _computer_tool = AnthropicComputerTool(
-                type=tool["type"],
-                name=tool["function"].get("name", "computer"),
-                display_width_px=_display_width_px,
-                display_height_px=_display_height_px,
-            )
+            _computer_tool: AnthropicComputerTool = {
+                "type": tool_type,
+                "name": fn.get("name", "computer"),
+                "display_width_px": _display_width_px,
+                "display_height_px": _display_height_px,
+            }
 
-            _display_number = tool["function"]["parameters"].get("display_number")
+            _display_number = params.get("display_number")
             if _display_number is not None:
                 _computer_tool["display_number"] = _display_number
 
             returned_tool = _computer_tool
-        elif tool["type"].startswith("bash_") or tool["type"].startswith(
-            "text_editor_"
-        ):
-            function_name = tool["function"].get("name")
+        elif tool_type.startswith(("bash_", "text_editor_")):
+            function_name = fn.get("name")
             if function_name is None:
                 raise ValueError("Missing required parameter: name")
 
-            returned_tool = AnthropicHostedTools(
-                type=tool["type"],
-                name=function_name,
-            )
+            hosted_tool: AnthropicHostedTools = {
+                "type": tool_type,
+                "name": function_name,
+            }
+            returned_tool = hosted_tool
         if returned_tool is None:
-            raise ValueError(f"Unsupported tool type: {tool['type']}")
+            raise ValueError(f"Unsupported tool type: {tool_type}")
 
         ## check if cache_control is set in the tool
         _cache_control = tool.get("cache_control", None)
-        _cache_control_function = tool.get("function", {}).get("cache_control", None)
+        _cache_control_function = fn.get("cache_control", None)
         if _cache_control is not None:
             returned_tool["cache_control"] = _cache_control
         elif _cache_control_function is not None and isinstance(
@@ -285,24 +416,16 @@ class AnthropicConfig(BaseConfig):
     def _map_stop_sequences(
         self, stop: Optional[Union[str, List[str]]]
     ) -> Optional[List[str]]:
-        new_stop: Optional[List[str]] = None
+        # anthropic doesn't allow whitespace characters as stop-sequences
+        drop_whitespace = litellm.drop_params is True
         if isinstance(stop, str):
-            if (
-                stop.isspace() and litellm.drop_params is True
-            ):  # anthropic doesn't allow whitespace characters as stop-sequences
-                return new_stop
-            new_stop = [stop]
+            if drop_whitespace and stop.isspace():
+                return None
+            return [stop]
         elif isinstance(stop, list):
-            new_v = []
-            for v in stop:
-                if (
-                    v.isspace() and litellm.drop_params is True
-                ):  # anthropic doesn't allow whitespace characters as stop-sequences
-                    continue
-                new_v.append(v)
-            if len(new_v) > 0:
-                new_stop = new_v
-        return new_stop
+            new_stop = [v for v in stop if not (drop_whitespace and v.isspace())]
+            return new_stop or None
+        return None
 
     @staticmethod
     def _map_reasoning_effort(
@@ -346,6 +469,105 @@ class AnthropicConfig(BaseConfig):
 
         return _tool
 
+    def _map_tools_param(
+        self,
+        value: Any,
+        non_default_params: dict,
+        optional_params: dict,
+        is_thinking_enabled: bool,
+    ) -> dict:
+        tool_value = self._map_tools(value)
+        return self._add_tools_to_optional_params(
+            optional_params=optional_params, tools=tool_value
+        )
+
+    def _map_tool_choice_param(
+        self,
+        value: Any,
+        non_default_params: dict,
+        optional_params: dict,
+        is_thinking_enabled: bool,
+    ) -> dict:
+        # registered for both 'tool_choice' and 'parallel_tool_calls' - map both in one go
+        _tool_choice: Optional[AnthropicMessagesToolChoice] = self._map_tool_choice(
+            tool_choice=non_default_params.get("tool_choice"),
+            parallel_tool_use=non_default_params.get("parallel_tool_calls"),
+        )
+
+        if _tool_choice is not None:
+            optional_params["tool_choice"] = _tool_choice
+        return optional_params
+
+    def _map_stream_param(
+        self,
+        value: Any,
+        non_default_params: dict,
+        optional_params: dict,
+        is_thinking_enabled: bool,
+    ) -> dict:
+        if value is True:
+            optional_params["stream"] = value
+        return optional_params
+
+    def _map_stop_param(
+        self,
+        value: Any,
+        non_default_params: dict,
+        optional_params: dict,
+        is_thinking_enabled: bool,
+    ) -> dict:
+        if isinstance(value, str) or isinstance(value, list):
+            _value = self._map_stop_sequences(value)
+            if _value is not None:
+                optional_params["stop_sequences"] = _value
+        return optional_params
+
+    def _map_response_format_param(
+        self,
+        value: Any,
+        non_default_params: dict,
+        optional_params: dict,
+        is_thinking_enabled: bool,
+    ) -> dict:
+        if not isinstance(value, dict):
+            return optional_params
+        _tool = self.map_response_format_to_anthropic_tool(
+            value, optional_params, is_thinking_enabled
+        )
+        if _tool is None:
+            return optional_params
+        if not is_thinking_enabled:
+            _tool_choice: AnthropicMessagesToolChoice = {
+                "name": RESPONSE_FORMAT_TOOL_NAME,
+                "type": "tool",
+            }
+            optional_params["tool_choice"] = _tool_choice
+        optional_params["json_mode"] = True
+        return self._add_tools_to_optional_params(
+            optional_params=optional_params, tools=[_tool]
+        )
+
+    def _map_user_param(
+        self,
+        value: Any,
+        non_default_params: dict,
+        optional_params: dict,
+        is_thinking_enabled: bool,
+    ) -> dict:
+        optional_params["metadata"] = {"user_id": value}
+        return optional_params
+
+    def _map_reasoning_effort_param(
+        self,
+        value: Any,
+        non_default_params: dict,
+        optional_params: dict,
+        is_thinking_enabled: bool,
+    ) -> dict:
+        if isinstance(value, str):
+            optional_params["thinking"] = AnthropicConfig._map_reasoning_effort(value)
+        return optional_params
+
     def map_openai_params(
         self,
         non_default_params: dict,
@@ -358,56 +580,17 @@ class AnthropicConfig(BaseConfig):
         )
 
         for param, value in non_default_params.items():
-            if param == "max_tokens":
-                optional_params["max_tokens"] = value
-            if param == "max_completion_tokens":
-                optional_params["max_tokens"] = value
-            if param == "tools":
-                # check if optional params already has tools
-                tool_value = self._map_tools(value)
-                optional_params = self._add_tools_to_optional_params(
-                    optional_params=optional_params, tools=tool_value
-                )
-            if param == "tool_choice" or param == "parallel_tool_calls":
-                _tool_choice: Optional[
-                    AnthropicMessagesToolChoice
-                ] = self._map_tool_choice(
-                    tool_choice=non_default_params.get("tool_choice"),
-                    parallel_tool_use=non_default_params.get("parallel_tool_calls"),
-                )
-
-                if _tool_choice is not None:
-                    optional_params["tool_choice"] = _tool_choice
-            if param == "stream" and value is True:
-                optional_params["stream"] = value
-            if param == "stop" and (isinstance(value, str) or isinstance(value, list)):
-                _value = self._map_stop_sequences(value)
-                if _value is not None:
-                    optional_params["stop_sequences"] = _value
-            if param == "temperature":
-                optional_params["temperature"] = value
-            if param == "top_p":
-                optional_params["top_p"] = value
-            if param == "response_format" and isinstance(value, dict):
-                _tool = self.map_response_format_to_anthropic_tool(
-                    value, optional_params, is_thinking_enabled
-                )
-                if _tool is None:
-                    continue
-                if not is_thinking_enabled:
-                    _tool_choice = {"name": RESPONSE_FORMAT_TOOL_NAME, "type": "tool"}
-                    optional_params["tool_choice"] = _tool_choice
-                optional_params["json_mode"] = True
-                optional_params = self._add_tools_to_optional_params(
-                    optional_params=optional_params, tools=[_tool]
-                )
-            if param == "user":
-                optional_params["metadata"] = {"user_id": value}
-            if param == "thinking":
-                optional_params["thinking"] = value
-            elif param == "reasoning_effort" and isinstance(value, str):
-                optional_params["thinking"] = AnthropicConfig._map_reasoning_effort(
-                    value
+            anthropic_param = _DIRECT_OPENAI_PARAMS.get(param)
+            if anthropic_param is not None:
+                optional_params[anthropic_param] = value
+                continue
+            handler_name = _OPENAI_PARAM_HANDLERS.get(param)
+            if handler_name is not None:
+                optional_params = getattr(self, handler_name)(
+                    value=value,
+                    non_default_params=non_default_params,
+                    optional_params=optional_params,
+                    is_thinking_enabled=is_thinking_enabled,
                 )
 
         ## handle thinking tokens
@@ -429,22 +612,21 @@ class AnthropicConfig(BaseConfig):
         Returns:
             AnthropicMessagesTool: The tool call to send to Anthropic API to get responses in JSON format
         """
-        _input_schema: AnthropicInputSchema = AnthropicInputSchema(
-            type="object",
-        )
-
+        _input_schema: AnthropicInputSchema
         if json_schema is None:
             # Anthropic raises a 400 BadRequest error if properties is passed as None
             # see usage with additionalProperties (Example 5) https://github.com/anthropics/anthropic-cookbook/blob/main/tool_use/extracting_structured_json.ipynb
-            _input_schema["additionalProperties"] = True
-            _input_schema["properties"] = {}
+            _input_schema = {
+                "type": "object",
+                "additionalProperties": True,
+                "properties": {},
+            }
         else:
-            _input_schema.update(cast(AnthropicInputSchema, json_schema))
+            _input_schema = cast(
+                AnthropicInputSchema, {"type": "object", **json_schema}
+            )
 
-        _tool = AnthropicMessagesTool(
-            name=RESPONSE_FORMAT_TOOL_NAME, input_schema=_input_schema
-        )
-        return _tool
+        return {"name": RESPONSE_FORMAT_TOOL_NAME, "input_schema": _input_schema}
 
     def is_cache_control_set(self, messages: List[AllMessageValues]) -> bool:
         """
@@ -452,42 +634,62 @@ class AnthropicConfig(BaseConfig):
 
         Used to check if anthropic prompt caching headers need to be set.
         """
-        for message in messages:
-            if message.get("cache_control", None) is not None:
-                return True
-            _message_content = message.get("content")
-            if _message_content is not None and isinstance(_message_content, list):
-                for content in _message_content:
-                    if "cache_control" in content:
-                        return True
-
-        return False
+        return any(
+            message.get("cache_control", None) is not None
+            or (
+                isinstance(_message_content := message.get("content"), list)
+                and any("cache_control" in content for content in _message_content)
+            )
+            for message in messages
+        )
 
     def is_computer_tool_used(
         self, tools: Optional[List[AllAnthropicToolsValues]]
     ) -> bool:
         if tools is None:
             return False
-        for tool in tools:
-            if "type" in tool and tool["type"].startswith("computer_"):
-                return True
-        return False
+        return any(tool.get("type", "").startswith("computer_") for tool in tools)
 
     def is_pdf_used(self, messages: List[AllMessageValues]) -> bool:
         """
         Set to true if media passed into messages.
 
         """
+        return any(
+            content.get("type", "text") != "text"
+            for message in messages
+            if isinstance(_message_content := message.get("content"), list)
+            for content in _message_content
+        )
+
+    def _scan_request_flags(
+        self,
+        messages: List[AllMessageValues],
+        tools: Optional[List[AllAnthropicToolsValues]],
+    ) -> Tuple[bool, bool, bool]:
+        """
+        Compute `is_cache_control_set`, `is_computer_tool_used` and `is_pdf_used` in a single pass over the messages.
+
+        Returns:
+            Tuple[bool, bool, bool]: (prompt_caching_set, computer_tool_used, pdf_used)
+        """
+        prompt_caching_set = False
+        pdf_used = False
         for message in messages:
-            if (
-                "content" in message
-                and message["content"] is not None
-                and isinstance(message["content"], list)
-            ):
-                for content in message["content"]:
+            if message.get("cache_control", None) is not None:
+                prompt_caching_set = True
+            _message_content = message.get("content")
+            if _message_content is not None and isinstance(_message_content, list):
+                for content in _message_content:
+                    if "cache_control" in content:
+                        prompt_caching_set = True
                     if "type" in content and content["type"] != "text":
-                        return True
-        return False
+                        pdf_used = True
+            if prompt_caching_set and pdf_used:
+                break
+
+        computer_tool_used = self.is_computer_tool_used(tools=tools)
+        return prompt_caching_set, computer_tool_used, pdf_used
 
     def translate_system_message(
         self, messages: List[AllMessageValues]
@@ -497,11 +699,14 @@ class AnthropicConfig(BaseConfig):
 
         Removes system message from the original list and returns a new list of anthropic system message content.
         """
-        system_prompt_indices = []
+        if not any(message["role"] == "system" for message in messages):
+            return []
+
+        kept_messages: List[AllMessageValues] = []
         anthropic_system_message_list: List[AnthropicSystemMessageContent] = []
-        for idx, message in enumerate(messages):
+        for message in messages:
+            valid_content = False
             if message["role"] == "system":
-                valid_content: bool = False
                 system_message_block = ChatCompletionSystemMessage(**message)
                 if isinstance(system_message_block["content"], str):
                     anthropic_system_message_content = AnthropicSystemMessageContent(
@@ -534,11 +739,10 @@ class AnthropicConfig(BaseConfig):
                         )
                     valid_content = True
 
-                if valid_content:
-                    system_prompt_indices.append(idx)
-        if len(system_prompt_indices) > 0:
-            for idx in reversed(system_prompt_indices):
-                messages.pop(idx)
+            if not valid_content:
+                kept_messages.append(message)
+        if len(kept_messages) != len(messages):
+            messages[:] = kept_messages
 
         return anthropic_system_message_list
 
@@ -592,7 +796,7 @@ class AnthropicConfig(BaseConfig):
             )  # don't use verbose_logger.exception, if exception is raised
 
         ## Load Config
-        config = litellm.AnthropicConfig.get_config()
+        config = litellm.AnthropicConfig._get_cached_config()
         for k, v in config.items():
             if (
                 k not in optional_params
@@ -645,27 +849,28 @@ class AnthropicConfig(BaseConfig):
         Optional[str],
         List[ChatCompletionToolCallChunk],
     ]:
-        text_content = ""
+        content_blocks: List[dict] = completion_response["content"]
         citations: Optional[List[Any]] = None
         thinking_blocks: Optional[List[ChatCompletionThinkingBlock]] = None
         reasoning_content: Optional[str] = None
-        tool_calls: List[ChatCompletionToolCallChunk] = []
-        for idx, content in enumerate(completion_response["content"]):
-            if content["type"] == "text":
-                text_content += content["text"]
-            ## TOOL CALLING
-            elif content["type"] == "tool_use":
-                tool_calls.append(
-                    ChatCompletionToolCallChunk(
-                        id=content["id"],
-                        type="function",
-                        function=ChatCompletionToolCallFunctionChunk(
-                            name=content["name"],
-                            arguments=json.dumps(content["input"]),
-                        ),
-                        index=idx,
-                    )
-                )
+        text_content = "".join(
+            [content["text"] for content in content_blocks if content["type"] == "text"]
+        )
+        ## TOOL CALLING
+        tool_calls: List[ChatCompletionToolCallChunk] = [
+            {
+                "id": content["id"],
+                "type": "function",
+                "function": {
+                    "name": content["name"],
+                    "arguments": json.dumps(content["input"]),
+                },
+                "index": idx,
+            }
+            for idx, content in enumerate(content_blocks)
+            if content["type"] == "tool_use"
+        ]
+        for content in content_blocks:
             ## CITATIONS
             if content.get("citations", None) is not None:
                 if citations is None:
@@ -676,10 +881,9 @@ class AnthropicConfig(BaseConfig):
                     thinking_blocks = []
                 thinking_blocks.append(cast(ChatCompletionThinkingBlock, content))
         if thinking_blocks is not None:
-            reasoning_content = ""
-            for block in thinking_blocks:
-                if "thinking" in block:
-                    reasoning_content += block["thinking"]
+            reasoning_content = "".join(
+                block["thinking"] for block in thinking_blocks if "thinking" in block
+            )
         return text_content, citations, thinking_blocks, reasoning_content, tool_calls
 
     def transform_response(
@@ -710,7 +914,7 @@ class AnthropicConfig(BaseConfig):
 
         ## RESPONSE OBJECT
         try:
-            completion_response = raw_response.json()
+            completion_response = fast_response_json(raw_response)
         except Exception as e:
             response_headers = getattr(raw_response, "headers", None)
             raise AnthropicError(
@@ -829,7 +1033,7 @@ class AnthropicConfig(BaseConfig):
         )
         try:
             if json_mode_content_str is not None:
-                args = json.loads(json_mode_content_str)
+                args = fast_json_loads(json_mode_content_str)
                 if (
                     isinstance(args, dict)
                     and (values := args.get("values")) is not None
@@ -879,9 +1083,11 @@ class AnthropicConfig(BaseConfig):
             )
 
         tools = optional_params.get("tools")
-        prompt_caching_set = self.is_cache_control_set(messages=messages)
-        computer_tool_used = self.is_computer_tool_used(tools=tools)
-        pdf_used = self.is_pdf_used(messages=messages)
+        (
+            prompt_caching_set,
+            computer_tool_used,
+            pdf_used,
+        ) = self._scan_request_flags(messages=messages, tools=tools)
         user_anthropic_beta_headers = self._get_user_anthropic_beta_headers(
             anthropic_beta_header=headers.get("anthropic-beta")
         )
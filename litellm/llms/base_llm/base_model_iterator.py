@@ -3,6 +3,7 @@ from abc import abstractmethod
 from typing import Optional, Union
 
 import litellm
+from litellm.litellm_core_utils.fast_json import fast_json_loads
 from litellm.types.utils import GenericStreamingChunk, ModelResponseStream
 
 
@@ -40,7 +41,9 @@ class BaseModelResponseIterator:
         )
         try:
             if stripped_chunk is not None:
-                stripped_json_chunk: Optional[dict] = json.loads(stripped_chunk)
+                stripped_json_chunk: Optional[dict] = fast_json_loads(
+                    stripped_chunk
+                )
             else:
                 stripped_json_chunk = None
         except json.JSONDecodeError:
@@ -18,6 +18,7 @@ import httpx
 from pydantic import BaseModel
 
 from litellm.constants import RESPONSE_FORMAT_TOOL_NAME
+from litellm.litellm_core_utils.fast_json import fast_response_json
 from litellm.litellm_core_utils.llm_response_utils.convert_dict_to_response import (
     _handle_invalid_parallel_tool_calls,
     _should_convert_tool_call_to_json_mode,
@@ -27,6 +28,7 @@ from litellm.litellm_core_utils.prompt_templates.common_utils import (
     strip_name_from_messages,
 )
 from litellm.llms.base_llm.base_model_iterator import BaseModelResponseIterator
+from litellm.llms.base_llm.base_utils import _convert_tool_response_to_message
 from litellm.types.llms.anthropic import AnthropicMessagesTool
 from litellm.types.llms.databricks import (
     AllDatabricksContentValues,
@@ -264,13 +266,14 @@ class DatabricksConfig(DatabricksBase, OpenAILikeChatConfig, AnthropicConfig):
         - content in list format.
         - 'name' in user message.
         """
-        new_messages = []
-        for idx, message in enumerate(messages):
-            if isinstance(message, BaseModel):
-                _message = message.model_dump(exclude_none=True)
-            else:
-                _message = message
-            new_messages.append(_message)
+        new_messages = [
+            (
+                message.model_dump(exclude_none=True)
+                if isinstance(message, BaseModel)
+                else message
+            )
+            for message in messages
+        ]
         new_messages = handle_messages_with_content_list_to_str_conversion(new_messages)
         new_messages = strip_name_from_messages(new_messages)
         return super()._transform_messages(messages=new_messages, model=model)
@@ -284,11 +287,7 @@ class DatabricksConfig(DatabricksBase, OpenAILikeChatConfig, AnthropicConfig):
         if isinstance(content, str):
             return content
         elif isinstance(content, list):
-            content_str = ""
-            for item in content:
-                if item["type"] == "text":
-                    content_str += item["text"]
-            return content_str
+            return "".join(item["text"] for item in content if item["type"] == "text")
         else:
             raise Exception(f"Unsupported content type: {type(content)}")
 
@@ -301,24 +300,67 @@ class DatabricksConfig(DatabricksBase, OpenAILikeChatConfig, AnthropicConfig):
         """
         if content is None:
             return None, None
+        if not isinstance(content, list):
+            return None, None
+        summaries = [
+            summary
+            for item in content
+            if item["type"] == "reasoning"
+            for summary in item["summary"]
+        ]
+        if not summaries:
+            return None, None
+        thinking_blocks = [
+            ChatCompletionThinkingBlock(
+                type="thinking",
+                thinking=summary["text"],
+                signature=summary["signature"],
+            )
+            for summary in summaries
+        ]
+        return "".join(summary["text"] for summary in summaries), thinking_blocks
+
+    @staticmethod
+    def _extract_content_and_reasoning(
+        content: Optional[AllDatabricksContentValues],
+    ) -> Tuple[
+        Optional[str], Optional[str], Optional[List[ChatCompletionThinkingBlock]]
+    ]:
+        """
+        Single pass equivalent of `extract_content_str` + `extract_reasoning_content`
+
+        Returns (content_str, reasoning_content, thinking_blocks)
+        """
+        if content is None:
+            return None, None, None
+        if isinstance(content, str):
+            return content, None, None
+        if not isinstance(content, list):
+            raise Exception(f"Unsupported content type: {type(content)}")
+
+        text_parts: List[str] = []
         thinking_blocks: Optional[List[ChatCompletionThinkingBlock]] = None
+        for item in content:
+            if item["type"] == "text":
+                text_parts.append(item["text"])
+            elif item["type"] == "reasoning":
+                if thinking_blocks is None:
+                    thinking_blocks = []
+                thinking_blocks.extend(
+                    ChatCompletionThinkingBlock(
+                        type="thinking",
+                        thinking=summary["text"],
+                        signature=summary["signature"],
+                    )
+                    for summary in item["summary"]
+                )
+
         reasoning_content: Optional[str] = None
-        if isinstance(content, list):
-            for item in content:
-                if item["type"] == "reasoning":
-                    for sum in item["summary"]:
-                        if reasoning_content is None:
-                            reasoning_content = ""
-                        reasoning_content += sum["text"]
-                        thinking_block = ChatCompletionThinkingBlock(
-                            type="thinking",
-                            thinking=sum["text"],
-                            signature=sum["signature"],
-                        )
-                        if thinking_blocks is None:
-                            thinking_blocks = []
-                        thinking_blocks.append(thinking_block)
-        return reasoning_content, thinking_blocks
+        if thinking_blocks:
+            reasoning_content = "".join(block["thinking"] for block in thinking_blocks)
+        else:
+            thinking_blocks = None
+        return "".join(text_parts), reasoning_content, thinking_blocks
 
     def _transform_choices(
         self, choices: List[DatabricksChoice], json_mode: Optional[bool] = None
@@ -355,17 +397,13 @@ class DatabricksConfig(DatabricksBase, OpenAILikeChatConfig, AnthropicConfig):
                     finish_reason = "stop"
 
             if translated_message is None:
-                ## get the content str
-                content_str = DatabricksConfig.extract_content_str(
-                    choice["message"]["content"]
-                )
-
-                ## get the reasoning content
+                ## get the content str + reasoning content
                 (
+                    content_str,
                     reasoning_content,
                     thinking_blocks,
-                ) = DatabricksConfig.extract_reasoning_content(
-                    choice["message"].get("content")
+                ) = DatabricksConfig._extract_content_and_reasoning(
+                    choice["message"]["content"]
                 )
 
                 translated_message = Message(
@@ -415,7 +453,9 @@ class DatabricksConfig(DatabricksBase, OpenAILikeChatConfig, AnthropicConfig):
 
         ## RESPONSE OBJECT
         try:
-            completion_response = DatabricksResponse(**raw_response.json())  # type: ignore
+            completion_response = DatabricksResponse(  # type: ignore
+                **fast_response_json(raw_response)
+            )
         except Exception as e:
             response_headers = getattr(raw_response, "headers", None)
             raise DatabricksException(
@@ -464,10 +504,13 @@ class DatabricksChatResponseIterator(BaseModelResponseIterator):
         self._last_function_name = None  # Track the last seen function name
 
     def chunk_parser(self, chunk: dict) -> ModelResponseStream:
+        extract_content_and_reasoning = DatabricksConfig._extract_content_and_reasoning
         try:
-            translated_choices = []
+            translated_choices: list = []
             for choice in chunk["choices"]:
-                tool_calls = choice["delta"].get("tool_calls")
+                # build new delta dicts, the raw chunk is left untouched for logging
+                delta: dict = choice["delta"]
+                tool_calls = delta.get("tool_calls")
                 if tool_calls and self.json_mode:
                     # 1. Check if the function name is set and == RESPONSE_FORMAT_TOOL_NAME
                     # 2. If no function name, just args -> check last function name (saved via state variable)
@@ -475,10 +518,6 @@ class DatabricksChatResponseIterator(BaseModelResponseIterator):
                     # 4. Convert json to message
                     # 5. Set content to message.content
                     # 6. Set tool_calls to None
-                    from litellm.constants import RESPONSE_FORMAT_TOOL_NAME
-                    from litellm.llms.base_llm.base_utils import (
-                        _convert_tool_response_to_message,
-                    )
 
                     # Check if this chunk has a function name
                     function_name = tool_calls[0].get("function", {}).get("name")
@@ -496,26 +535,30 @@ class DatabricksChatResponseIterator(BaseModelResponseIterator):
                         if message is not None:
                             if message.content == "{}":  # empty json
                                 message.content = ""
-                            choice["delta"]["content"] = message.content
-                            choice["delta"]["tool_calls"] = None
+                            delta = {
+                                **delta,
+                                "content": message.content,
+                                "tool_calls": None,
+                            }
 
-                # extract the content str
-                content_str = DatabricksConfig.extract_content_str(
-                    choice["delta"].get("content")
-                )
-
-                # extract the reasoning content
+                # extract the content str + reasoning content
                 (
+                    content_str,
                     reasoning_content,
                     thinking_blocks,
-                ) = DatabricksConfig.extract_reasoning_content(
-                    choice["delta"]["content"]
+                ) = extract_content_and_reasoning(delta["content"])
+
+                translated_choices.append(
+                    {
+                        **choice,
+                        "delta": {
+                            **delta,
+                            "content": content_str,
+                            "reasoning_content": reasoning_content,
+                            "thinking_blocks": thinking_blocks,
+                        },
+                    }
                 )
-
-                choice["delta"]["content"] = content_str
-                choice["delta"]["reasoning_content"] = reasoning_content
-                choice["delta"]["thinking_blocks"] = thinking_blocks
-                translated_choices.append(choice)
             return ModelResponseStream(
                 id=chunk["id"],
                 object="chat.completion.chunk",
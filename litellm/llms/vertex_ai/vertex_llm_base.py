@@ -4,12 +4,33 @@ Base Vertex, Google AI Studio LLM Class
 Handles Authentication and generating request urls for Vertex AI and Google AI Studio
 """
 
+import asyncio
+import hashlib
 import json
 import os
-from typing import TYPE_CHECKING, Any, Dict, Literal, Optional, Tuple
+import threading
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    Literal,
+    Optional,
+    Tuple,
+)
 
 from litellm._logging import verbose_logger
+from litellm.constants import (
+    DEFAULT_MAX_LRU_CACHE_SIZE,
+    VERTEX_ACCESS_TOKEN_MIN_REMAINING_SECONDS,
+    VERTEX_ACCESS_TOKEN_REFRESH_BUFFER_SECONDS,
+)
 from litellm.litellm_core_utils.asyncify import asyncify
+from litellm.litellm_core_utils.fast_json import fast_json_dumps_sorted
+from litellm.litellm_core_utils.thread_pool_executor import executor
 from litellm.llms.base import BaseLLM
 from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler
 from litellm.types.llms.vertex_ai import VERTEX_CREDENTIALS_TYPES
@@ -22,16 +43,80 @@ else:
     GoogleCredentialsObject = Any
 
 
+@lru_cache(maxsize=1)
+def _get_auth_request() -> Any:
+    """
+    Shared google-auth transport, so token refreshes reuse one pooled `requests.Session`
+
+    `Request()` builds a new session (and TLS connection) on every call otherwise.
+    """
+    from google.auth.transport.requests import (
+        Request,  # type: ignore[import-untyped]
+    )
+
+    return Request()
+
+
+@lru_cache(maxsize=DEFAULT_MAX_LRU_CACHE_SIZE)
+def _build_proxy_url(api_base: str, endpoint: str, stream: bool) -> str:
+    url = "{}:{}".format(api_base, endpoint)
+    if stream:
+        url = url + "?alt=sse"
+    return url
+
+
 class VertexBase(BaseLLM):
+    # BaseLLM has no __slots__, so instances keep a __dict__ (subclasses and
+    # mock.patch.object still work) - this just moves the per-request state into
+    # fixed slots for cheaper attribute access
+    __slots__ = (
+        "access_token",
+        "refresh_token",
+        "_credentials",
+        "project_id",
+        "async_handler",
+    )
+
+    # Loaded google-auth credentials are process-global - shared by every
+    # VertexBase instance, so each credential is only loaded once per process
+    _credentials_project_mapping: ClassVar[
+        Dict[
+            Tuple[Optional[VERTEX_CREDENTIALS_TYPES], Optional[str]],
+            GoogleCredentialsObject,
+        ]
+    ] = {}
+    # credential cache key -> (access token, project id, expiry epoch seconds).
+    # shared like the credentials, so a background refresh is seen by every instance
+    _access_token_cache: ClassVar[
+        Dict[
+            Tuple[Optional[VERTEX_CREDENTIALS_TYPES], Optional[str]],
+            Tuple[str, str, float],
+        ]
+    ] = {}
+    # guards writes to the shared maps above / below
+    _credentials_project_mapping_lock: ClassVar[threading.Lock] = threading.Lock()
+    # single-flight locks, shared like the credentials they guard - so instances
+    # using the same credentials never refresh them at the same time
+    _credential_locks: ClassVar[
+        Dict[
+            Tuple[Optional[VERTEX_CREDENTIALS_TYPES], Optional[str]],
+            threading.Lock,
+        ]
+    ] = {}
+    # lets concurrent coroutines wait on one refresh without each holding a thread.
+    # an asyncio.Lock only works on one event loop, so it is stored with its loop
+    _async_credential_locks: ClassVar[
+        Dict[
+            Tuple[Optional[VERTEX_CREDENTIALS_TYPES], Optional[str]],
+            Tuple[asyncio.AbstractEventLoop, asyncio.Lock],
+        ]
+    ] = {}
+
     def __init__(self) -> None:
         super().__init__()
         self.access_token: Optional[str] = None
         self.refresh_token: Optional[str] = None
         self._credentials: Optional[GoogleCredentialsObject] = None
-        self._credentials_project_mapping: Dict[
-            Tuple[Optional[VERTEX_CREDENTIALS_TYPES], Optional[str]],
-            GoogleCredentialsObject,
-        ] = {}
         self.project_id: Optional[str] = None
         self.async_handler: Optional[AsyncHTTPHandler] = None
 
@@ -43,9 +128,6 @@ class VertexBase(BaseLLM):
     ) -> Tuple[Any, str]:
         import google.auth as google_auth
         from google.auth import identity_pool
-        from google.auth.transport.requests import (
-            Request,  # type: ignore[import-untyped]
-        )
 
         if credentials is not None:
             import google.oauth2.service_account
@@ -63,7 +145,8 @@ class VertexBase(BaseLLM):
 
                 try:
                     if os.path.exists(credentials):
-                        json_obj = json.load(open(credentials))
+                        with open(credentials) as credentials_file:
+                            json_obj = json.load(credentials_file)
                     else:
                         json_obj = json.loads(credentials)
                 except Exception:
@@ -100,7 +183,7 @@ class VertexBase(BaseLLM):
             if project_id is None:
                 project_id = creds_project_id
 
-        creds.refresh(Request())  # type: ignore
+        creds.refresh(_get_auth_request())  # type: ignore
 
         if not project_id:
             raise ValueError("Could not resolve project_id")
@@ -113,11 +196,7 @@ class VertexBase(BaseLLM):
         return creds, project_id
 
     def refresh_auth(self, credentials: Any) -> None:
-        from google.auth.transport.requests import (
-            Request,  # type: ignore[import-untyped]
-        )
-
-        credentials.refresh(Request())
+        credentials.refresh(_get_auth_request())
 
     def _ensure_access_token(
         self,
@@ -171,7 +250,6 @@ class VertexBase(BaseLLM):
         """
         if api_base:
             if custom_llm_provider == "gemini":
-                url = "{}:{}".format(api_base, endpoint)
                 if gemini_api_key is None:
                     raise ValueError(
                         "Missing gemini_api_key, please set `GEMINI_API_KEY`"
@@ -179,11 +257,8 @@ class VertexBase(BaseLLM):
                 auth_header = (
                     gemini_api_key  # cloudflare expects api key as bearer token
                 )
-            else:
-                url = "{}:{}".format(api_base, endpoint)
-
-            if stream is True:
-                url = url + "?alt=sse"
+            # only the url is cached - auth_header can differ per request
+            url = _build_proxy_url(api_base, endpoint, stream is True)
         return auth_header, url
 
     def _get_token_and_url(
@@ -242,6 +317,129 @@ class VertexBase(BaseLLM):
             url=url,
         )
 
+    @staticmethod
+    def _get_credential_cache_key(
+        credentials: Optional[VERTEX_CREDENTIALS_TYPES], project_id: Optional[str]
+    ) -> Tuple[Optional[VERTEX_CREDENTIALS_TYPES], Optional[str]]:
+        # Key dict credentials by the hex string (32 chars) of a 16-byte blake2b digest
+        cache_credentials = (
+            hashlib.blake2b(
+                fast_json_dumps_sorted(credentials), digest_size=16
+            ).hexdigest()
+            if isinstance(credentials, dict)
+            else credentials
+        )
+        return (cache_credentials, project_id)
+
+    @classmethod
+    def _get_credential_lock(
+        cls,
+        credential_cache_key: Tuple[Optional[VERTEX_CREDENTIALS_TYPES], Optional[str]],
+    ) -> threading.Lock:
+        with cls._credentials_project_mapping_lock:
+            lock = cls._credential_locks.get(credential_cache_key)
+            if lock is None:
+                lock = cls._credential_locks[credential_cache_key] = threading.Lock()
+            return lock
+
+    @classmethod
+    def _get_async_credential_lock(
+        cls,
+        credential_cache_key: Tuple[Optional[VERTEX_CREDENTIALS_TYPES], Optional[str]],
+    ) -> asyncio.Lock:
+        """
+        asyncio.Lock for `credential_cache_key` on the running event loop
+
+        Callers on other event loops still single-flight the refresh itself, through `_get_credential_lock` in `get_access_token`.
+        """
+        loop = asyncio.get_running_loop()
+        with cls._credentials_project_mapping_lock:
+            entry = cls._async_credential_locks.get(credential_cache_key)
+            if entry is None or entry[0] is not loop:
+                entry = cls._async_credential_locks[credential_cache_key] = (
+                    loop,
+                    asyncio.Lock(),
+                )
+            return entry[1]
+
+    def _get_cached_access_token(
+        self,
+        credential_cache_key: Tuple[Optional[VERTEX_CREDENTIALS_TYPES], Optional[str]],
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Return the cached (token, project_id), unless the token is about to expire
+
+        Near expiry, the cached token is still returned while a background refresh replaces it.
+        """
+        cached_token = self._access_token_cache.get(credential_cache_key)
+        if cached_token is None:
+            return None
+        token, project_id, expires_at = cached_token
+        seconds_left = expires_at - time.time()
+        if seconds_left <= VERTEX_ACCESS_TOKEN_MIN_REMAINING_SECONDS:
+            return None
+        if seconds_left <= VERTEX_ACCESS_TOKEN_REFRESH_BUFFER_SECONDS:
+            self._schedule_background_refresh(credential_cache_key)
+        return token, project_id
+
+    def _schedule_background_refresh(
+        self,
+        credential_cache_key: Tuple[Optional[VERTEX_CREDENTIALS_TYPES], Optional[str]],
+    ) -> None:
+        lock = self._get_credential_lock(credential_cache_key)
+        if not lock.acquire(blocking=False):
+            return  # a load / refresh for these credentials is already running
+        try:
+            executor.submit(self._background_refresh, credential_cache_key, lock)
+        except Exception:
+            lock.release()
+            raise
+
+    def _background_refresh(
+        self,
+        credential_cache_key: Tuple[Optional[VERTEX_CREDENTIALS_TYPES], Optional[str]],
+        lock: threading.Lock,
+    ) -> None:
+        """
+        Refresh the credentials for `credential_cache_key` and re-cache the token - runs with `lock` held
+        """
+        try:
+            _credentials = self._credentials_project_mapping.get(credential_cache_key)
+            cached_token = self._access_token_cache.get(credential_cache_key)
+            if _credentials is None or cached_token is None:
+                return
+            self.refresh_auth(_credentials)
+            self._cache_access_token(
+                credential_cache_key=credential_cache_key,
+                credentials=_credentials,
+                project_id=cached_token[1],
+            )
+        except Exception as e:
+            verbose_logger.warning(
+                "Vertex: background access token refresh failed - %s", str(e)
+            )
+        finally:
+            lock.release()
+
+    def _cache_access_token(
+        self,
+        credential_cache_key: Tuple[Optional[VERTEX_CREDENTIALS_TYPES], Optional[str]],
+        credentials: GoogleCredentialsObject,
+        project_id: str,
+    ) -> None:
+        expiry = getattr(credentials, "expiry", None)
+        if not isinstance(expiry, datetime):
+            # unknown token lifetime - keep checking `credentials.expired` per call
+            return
+        if expiry.tzinfo is None:  # google-auth stores expiry as naive UTC
+            expiry = expiry.replace(tzinfo=timezone.utc)
+        with self._credentials_project_mapping_lock:
+            self._access_token_cache[credential_cache_key] = (
+                credentials.token,
+                project_id,
+                expiry.timestamp(),
+            )
+
     def get_access_token(
         self,
         credentials: Optional[VERTEX_CREDENTIALS_TYPES],
@@ -250,18 +448,40 @@ class VertexBase(BaseLLM):
         """
         Get access token and project id
 
-        1. Check if credentials are already in self._credentials_project_mapping
-        2. If not, load credentials and add to self._credentials_project_mapping
-        3. Check if loaded credentials have expired
-        4. If expired, refresh credentials
-        5. Return access token and project id
+        1. Return the cached access token, if it is not close to expiring
+        2. Check if credentials are already in self._credentials_project_mapping
+        3. If not, load credentials and add to self._credentials_project_mapping
+        4. Check if loaded credentials have expired
+        5. If expired, refresh credentials
+        6. Return access token and project id
         """
-
-        # Convert dict credentials to string for caching
-        cache_credentials = (
-            json.dumps(credentials) if isinstance(credentials, dict) else credentials
+        credential_cache_key = self._get_credential_cache_key(
+            credentials=credentials, project_id=project_id
         )
-        credential_cache_key = (cache_credentials, project_id)
+        cached_token = self._get_cached_access_token(credential_cache_key)
+        if cached_token is not None:
+            return cached_token
+
+        # single-flight: concurrent callers for these credentials wait for one refresh
+        with self._get_credential_lock(credential_cache_key):
+            cached_token = self._get_cached_access_token(credential_cache_key)
+            if cached_token is not None:
+                return cached_token
+            return self._load_access_token(
+                credentials=credentials,
+                project_id=project_id,
+                credential_cache_key=credential_cache_key,
+            )
+
+    def _load_access_token(
+        self,
+        credentials: Optional[VERTEX_CREDENTIALS_TYPES],
+        project_id: Optional[str],
+        credential_cache_key: Tuple[Optional[VERTEX_CREDENTIALS_TYPES], Optional[str]],
+    ) -> Tuple[str, str]:
+        """
+        Load / refresh credentials for `credential_cache_key` - callers must hold its lock
+        """
         _credentials: Optional[GoogleCredentialsObject] = None
 
         verbose_logger.debug(
@@ -300,7 +520,12 @@ class VertexBase(BaseLLM):
                     )
                 )
 
-            self._credentials_project_mapping[credential_cache_key] = _credentials
+            # another instance may have loaded these credentials meanwhile - keep
+            # the first, so every instance refreshes the same credentials object
+            with self._credentials_project_mapping_lock:
+                _credentials = self._credentials_project_mapping.setdefault(
+                    credential_cache_key, _credentials
+                )
 
         ## VALIDATE CREDENTIALS
         verbose_logger.debug(f"Validating credentials for project_id: {project_id}")
@@ -335,6 +560,11 @@ class VertexBase(BaseLLM):
         if project_id is None:
             raise ValueError("Could not resolve project_id")
 
+        self._cache_access_token(
+            credential_cache_key=credential_cache_key,
+            credentials=_credentials,
+            project_id=project_id,
+        )
         return _credentials.token, project_id
 
     async def _ensure_access_token_async(
@@ -351,13 +581,22 @@ class VertexBase(BaseLLM):
         if custom_llm_provider == "gemini":
             return "", ""
         else:
-            try:
+            # skip the threadpool hop when the token is already cached
+            credential_cache_key = self._get_credential_cache_key(
+                credentials=credentials, project_id=project_id
+            )
+            cached_token = self._get_cached_access_token(credential_cache_key)
+            if cached_token is not None:
+                return cached_token
+            # only one coroutine per credentials goes to the threadpool to refresh
+            async with self._get_async_credential_lock(credential_cache_key):
+                cached_token = self._get_cached_access_token(credential_cache_key)
+                if cached_token is not None:
+                    return cached_token
                 return await asyncify(self.get_access_token)(
                     credentials=credentials,
                     project_id=project_id,
                 )
-            except Exception as e:
-                raise e
 
     def set_headers(
         self, auth_header: Optional[str], extra_headers: Optional[dict]
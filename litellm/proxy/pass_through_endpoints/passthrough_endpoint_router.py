@@ -1,11 +1,40 @@
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
 from litellm._logging import verbose_router_logger
+from litellm.constants import DEFAULT_MAX_LRU_CACHE_SIZE
 from litellm.secret_managers.main import get_secret_str
 from litellm.types.llms.vertex_ai import VERTEX_CREDENTIALS_TYPES
 from litellm.types.passthrough_endpoints.vertex_ai import VertexPassThroughCredentials
 
 
+@lru_cache(maxsize=DEFAULT_MAX_LRU_CACHE_SIZE)  # few providers x regions
+def _build_credential_name(
+    custom_llm_provider: str, region_name: Optional[str]
+) -> str:
+    if region_name is None:
+        return f"{custom_llm_provider.upper()}_API_KEY"
+    return f"{custom_llm_provider.upper()}_{region_name.upper()}_API_KEY"
+
+
+# provider -> ((api_base substring, region name), ...), checked in order
+_REGION_MARKERS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "assemblyai": (("eu", "eu"),),
+}
+
+
+@lru_cache(maxsize=DEFAULT_MAX_LRU_CACHE_SIZE)  # few providers x api bases
+def _region_name_from_api_base(
+    custom_llm_provider: str, api_base: Optional[str]
+) -> Optional[str]:
+    if not api_base:
+        return None
+    for marker, region_name in _REGION_MARKERS.get(custom_llm_provider, ()):
+        if marker in api_base:
+            return region_name
+    return None
+
+
 class PassthroughEndpointRouter:
     """
     Use this class to Set/Get credentials for pass-through endpoints
@@ -167,9 +196,7 @@ class PassthroughEndpointRouter:
         custom_llm_provider: str,
         region_name: Optional[str],
     ) -> str:
-        if region_name is None:
-            return f"{custom_llm_provider.upper()}_API_KEY"
-        return f"{custom_llm_provider.upper()}_{region_name.upper()}_API_KEY"
+        return _build_credential_name(custom_llm_provider, region_name)
 
     def _get_region_name_from_api_base(
         self,
@@ -179,15 +206,12 @@ class PassthroughEndpointRouter:
         """
         Get the region name from the API base.
 
-        Each provider might have a different way of specifying the region in the API base - this is where you can use conditional logic to handle that.
+        Each provider might have a different way of specifying the region in the API base - add its markers to `_REGION_MARKERS` to handle that.
         """
-        if custom_llm_provider == "assemblyai":
-            if api_base and "eu" in api_base:
-                return "eu"
-        return None
+        return _region_name_from_api_base(custom_llm_provider, api_base)
 
     @staticmethod
     def _get_default_env_variable_name_passthrough_endpoint(
         custom_llm_provider: str,
     ) -> str:
-        return f"{custom_llm_provider.upper()}_API_KEY"
+        return _build_credential_name(custom_llm_provider, None)
@@ -3102,7 +3102,13 @@ class Router:
                 return await self._pass_through_moderation_endpoint_factory(
                     original_function=original_function, **kwargs
                 )
-            elif call_type in ("anthropic_messages", "aresponses"):
+            elif call_type == "anthropic_messages":
+                return await self._ageneric_api_call_with_fallbacks(
+                    original_function=original_function,
+                    client=client,
+                    **kwargs,
+                )
+            elif call_type == "aresponses":
                 return await self._ageneric_api_call_with_fallbacks(
                     original_function=original_function,
                     **kwargs,
@@ -1,6 +1,7 @@
 import sys
 import ast
 import os
+from concurrent.futures import ProcessPoolExecutor
 
 # Extremely restrictive set of allowed numbers
 ALLOWED_NUMBERS = {
@@ -86,44 +87,56 @@ HTTP_STATUS_CODES = {
 }
 
 # Combine the sets
-ALLOWED_NUMBERS = ALLOWED_NUMBERS.union(HTTP_STATUS_CODES)
+ALLOWED_NUMBERS = frozenset(ALLOWED_NUMBERS.union(HTTP_STATUS_CODES))
 
 
-class HardcodedNumberFinder(ast.NodeVisitor):
-    def __init__(self):
-        self.hardcoded_numbers = []
+def find_hardcoded_numbers(tree):
+    """
+    Returns (line, value) for every numeric constant in `tree` not in ALLOWED_NUMBERS
+    """
+    hardcoded_numbers = []
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if (
+            type(node) is ast.Constant
+            and isinstance(node.value, (int, float))
+            and node.value not in ALLOWED_NUMBERS
+        ):
+            hardcoded_numbers.append((node.lineno, node.col_offset, node.value))
+        stack.extend(ast.iter_child_nodes(node))
+    # stack order isn't source order - report by position
+    hardcoded_numbers.sort(key=lambda hit: hit[:2])
+    return [(line, value) for line, _, value in hardcoded_numbers]
 
-    def visit_Constant(self, node):
-        # For Python 3.8+
-        if isinstance(node.value, (int, float)) and node.value not in ALLOWED_NUMBERS:
-            self.hardcoded_numbers.append((node.lineno, node.value))
-        self.generic_visit(node)
 
-    def visit_Num(self, node):
-        # For older Python versions
-        if node.n not in ALLOWED_NUMBERS:
-            self.hardcoded_numbers.append((node.lineno, node.n))
-        self.generic_visit(node)
-
-
-def check_file(filename):
+def scan_file(filename):
+    """
+    Returns (exit_code, report) for `filename` - report is "" when the file is clean
+    """
     try:
-        with open(filename, "r") as f:
+        # ast.parse decodes bytes itself (honouring PEP 263 coding lines)
+        with open(filename, "rb") as f:
             content = f.read()
 
-        tree = ast.parse(content)
-        finder = HardcodedNumberFinder()
-        finder.visit(tree)
+        tree = ast.parse(content, filename=filename)
+        hardcoded_numbers = find_hardcoded_numbers(tree)
 
-        if finder.hardcoded_numbers:
-            print(f"ERROR in {filename}: Hardcoded numbers detected:")
-            for line, value in finder.hardcoded_numbers:
-                print(f"  Line {line}: {value}")
-            return 1
-        return 0
+        if hardcoded_numbers:
+            report_lines = [f"ERROR in {filename}: Hardcoded numbers detected:"]
+            for line, value in hardcoded_numbers:
+                report_lines.append(f"  Line {line}: {value}")
+            return 1, "\n".join(report_lines)
+        return 0, ""
     except SyntaxError:
-        print(f"Syntax error in {filename}")
-        return 0
+        return 0, f"Syntax error in {filename}"
+
+
+def check_file(filename):
+    exit_code, report = scan_file(filename)
+    if report:
+        print(report)
+    return exit_code
 
 
 def main():
@@ -138,13 +151,22 @@ def main():
         "utils.py",
     ]
     ignore_folder = "types"
+    paths = []
     for root, dirs, files in os.walk(folder):
         for filename in files:
             if filename.endswith(".py") and filename not in ignore_files:
                 full_path = os.path.join(root, filename)
                 if ignore_folder in full_path:
                     continue
-                exit_code |= check_file(full_path)
+                paths.append(full_path)
+
+    # ast.parse is CPU-bound and files are independent - scan them across processes,
+    # printing reports from the parent so output stays in walk order
+    with ProcessPoolExecutor() as executor:
+        for file_exit_code, report in executor.map(scan_file, paths, chunksize=32):
+            if report:
+                print(report)
+            exit_code |= file_exit_code
     sys.exit(exit_code)
 
 
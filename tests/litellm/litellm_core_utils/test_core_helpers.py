@@ -0,0 +1,35 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.litellm_core_utils.core_helpers import map_finish_reason
+
+
+@pytest.mark.parametrize(
+    "finish_reason, expected",
+    [
+        ("end_turn", "stop"),
+        ("stop_sequence", "stop"),
+        ("max_tokens", "length"),
+        ("tool_use", "tool_calls"),
+        ("MAX_TOKENS", "length"),
+        ("SAFETY", "content_filter"),
+        ("stop", "stop"),
+        ("some_new_reason", "some_new_reason"),
+        (None, None),
+    ],
+)
+def test_map_finish_reason(finish_reason, expected):
+    assert map_finish_reason(finish_reason) == expected
+    # cached result stays the same
+    assert map_finish_reason(finish_reason) == expected
+
+
+def test_map_finish_reason_unhashable_passes_through():
+    finish_reason = {"reason": "stop"}
+    assert map_finish_reason(finish_reason) is finish_reason
@@ -0,0 +1,72 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.litellm_core_utils.credential_accessor import CredentialAccessor
+from litellm.types.utils import CredentialItem
+
+
+def _credential(name: str, api_key: str) -> CredentialItem:
+    return CredentialItem(
+        credential_name=name,
+        credential_values={"api_key": api_key},
+        credential_info={},
+    )
+
+
+@pytest.fixture(autouse=True)
+def credential_list(monkeypatch):
+    monkeypatch.setattr(
+        litellm, "credential_list", [_credential("a", "key-a"), _credential("b", "b")]
+    )
+
+
+def test_get_credential_values():
+    assert CredentialAccessor.get_credential_values("b") == {"api_key": "b"}
+    assert CredentialAccessor.get_credential_values("missing") == {}
+
+
+def test_get_credential_values_returns_copy():
+    CredentialAccessor.get_credential_values("a")["api_key"] = "changed"
+    assert CredentialAccessor.get_credential_values("a") == {"api_key": "key-a"}
+
+
+def test_get_credential_values_first_match_wins():
+    litellm.credential_list.append(_credential("a", "duplicate"))
+    assert CredentialAccessor.get_credential_values("a") == {"api_key": "key-a"}
+
+
+def test_get_credential_values_tracks_list_changes():
+    assert CredentialAccessor.get_credential_values("c") == {}
+
+    # append / pop on the same list
+    litellm.credential_list.append(_credential("c", "key-c"))
+    assert CredentialAccessor.get_credential_values("c") == {"api_key": "key-c"}
+    litellm.credential_list.pop(0)
+    assert CredentialAccessor.get_credential_values("a") == {}
+    assert CredentialAccessor.get_credential_values("c") == {"api_key": "key-c"}
+
+    # in-place edit, same length
+    litellm.credential_list[0] = _credential("d", "key-d")
+    assert CredentialAccessor.get_credential_values("d") == {"api_key": "key-d"}
+    assert CredentialAccessor.get_credential_values("b") == {}
+
+    # list replaced
+    litellm.credential_list = [_credential("e", "key-e")]
+    assert CredentialAccessor.get_credential_values("e") == {"api_key": "key-e"}
+    assert CredentialAccessor.get_credential_values("c") == {}
+
+
+def test_upsert_credentials_updates_lookup():
+    assert CredentialAccessor.get_credential_values("a") == {"api_key": "key-a"}
+    CredentialAccessor.upsert_credentials(
+        [_credential("a", "new-key-a"), _credential("c", "key-c")]
+    )
+    assert CredentialAccessor.get_credential_values("a") == {"api_key": "new-key-a"}
+    assert CredentialAccessor.get_credential_values("c") == {"api_key": "key-c"}
@@ -0,0 +1,58 @@
+import json
+import os
+import sys
+
+import httpx
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.litellm_core_utils import fast_json
+from litellm.litellm_core_utils.fast_json import (
+    fast_json_dumps_sorted,
+    fast_json_loads,
+    fast_response_json,
+)
+
+
+def test_fast_json_loads_str_and_bytes():
+    data = {"id": "msg_1", "content": [{"type": "text", "text": "héllo"}]}
+    assert fast_json_loads(json.dumps(data)) == data
+    assert fast_json_loads(json.dumps(data).encode("utf-8")) == data
+
+
+def test_fast_json_loads_matches_stdlib_for_orjson_rejected_input():
+    # orjson rejects NaN / Infinity and utf-16 bytes, the stdlib accepts them
+    assert fast_json_loads('{"a": Infinity}') == {"a": float("inf")}
+    assert fast_json_loads('{"a": 1}'.encode("utf-16")) == {"a": 1}
+
+
+def test_fast_json_loads_invalid_json_raises_stdlib_error():
+    with pytest.raises(json.JSONDecodeError):
+        fast_json_loads("invalid json")
+
+
+def test_fast_json_loads_without_orjson(monkeypatch):
+    monkeypatch.setattr(fast_json, "orjson", None)
+    assert fast_json_loads(b'{"a": 1}') == {"a": 1}
+
+
+def test_fast_response_json():
+    response = httpx.Response(200, json={"stop_reason": "end_turn"})
+    assert fast_response_json(response) == {"stop_reason": "end_turn"}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_fast_json_dumps_sorted(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(fast_json, "orjson", None)
+    data = {"b": 1, "a": {"d": "é", "c": [1, 2]}}
+
+    assert fast_json_dumps_sorted(data) == '{"a":{"c":[1,2],"d":"é"},"b":1}'.encode(
+        "utf-8"
+    )
+    assert fast_json_dumps_sorted(data) == fast_json_dumps_sorted(
+        {"a": {"c": [1, 2], "d": "é"}, "b": 1}
+    )
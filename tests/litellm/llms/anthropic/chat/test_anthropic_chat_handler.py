@@ -0,0 +1,287 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.llms.anthropic.chat.handler import (
+    _EMPTY_GENERIC_CHUNK,
+    ModelResponseIterator,
+)
+from litellm.llms.anthropic.common_utils import AnthropicError
+from litellm.types.utils import GenericStreamingChunk, ModelResponseStream
+
+
+TEXT_DELTA_CHUNK = {
+    "type": "content_block_delta",
+    "index": 0,
+    "delta": {"type": "text_delta", "text": "Hellö"},
+}
+
+
+@pytest.mark.parametrize(
+    "chunk, expected",
+    [
+        ('data: {"a": 1}', ' {"a": 1}'),
+        (b'event: ping\ndata: {"a": 1}', b' {"a": 1}'),
+        ("event: ping", None),
+        (b"event: ping", None),
+    ],
+)
+def test_get_sse_data(chunk, expected):
+    assert ModelResponseIterator._get_sse_data(chunk) == expected
+
+
+def test_convert_str_chunk_to_generic_chunk_str_and_bytes():
+    iterator = ModelResponseIterator(streaming_response=None, sync_stream=True)
+    str_line = "data: " + json.dumps(TEXT_DELTA_CHUNK)
+
+    str_chunk = iterator.convert_str_chunk_to_generic_chunk(chunk=str_line)
+    bytes_chunk = iterator.convert_str_chunk_to_generic_chunk(
+        chunk=("event: content_block_delta\n" + str_line).encode("utf-8")
+    )
+
+    assert str_chunk.choices[0].delta.content == "Hellö"
+    assert bytes_chunk.choices[0].delta.content == "Hellö"
+
+
+def test_convert_str_chunk_to_generic_chunk_non_data_line():
+    iterator = ModelResponseIterator(streaming_response=None, sync_stream=True)
+    chunk = iterator.convert_str_chunk_to_generic_chunk(chunk="event: ping")
+    assert isinstance(chunk, ModelResponseStream)
+
+
+def test_sync_iterator_skips_non_data_lines():
+    lines = iter(["event: content_block_delta", "data: " + json.dumps(TEXT_DELTA_CHUNK)])
+    iterator = ModelResponseIterator(streaming_response=lines, sync_stream=True)
+
+    chunks = list(iterator)
+
+    assert chunks[0] is _EMPTY_GENERIC_CHUNK
+    assert chunks[0] == GenericStreamingChunk(
+        text="",
+        is_finished=False,
+        finish_reason="",
+        usage=None,
+        index=0,
+        tool_use=None,
+    )
+    assert chunks[1].choices[0].delta.content == "Hellö"
+
+
+def test_chunk_parser_tool_use_stream():
+    iterator = ModelResponseIterator(streaming_response=None, sync_stream=True)
+    start = iterator.chunk_parser(
+        chunk={
+            "type": "content_block_start",
+            "index": 1,
+            "content_block": {
+                "type": "tool_use",
+                "id": "toolu_1",
+                "name": "get_weather",
+                "input": {},
+            },
+        }
+    )
+    delta_chunk = {
+        "type": "content_block_delta",
+        "index": 1,
+        "delta": {"type": "input_json_delta", "partial_json": '{"city": "SF"}'},
+    }
+    delta = iterator.chunk_parser(chunk=delta_chunk)
+    stop = iterator.chunk_parser(chunk={"type": "content_block_stop", "index": 1})
+
+    assert start.choices[0].delta.tool_calls[0].id == "toolu_1"
+    assert start.choices[0].delta.tool_calls[0].function.name == "get_weather"
+    assert (
+        delta.choices[0].delta.tool_calls[0].function.arguments == '{"city": "SF"}'
+    )
+    assert stop.choices[0].delta.tool_calls is None
+
+
+def test_chunk_parser_empty_tool_call_args():
+    iterator = ModelResponseIterator(streaming_response=None, sync_stream=True)
+    iterator.chunk_parser(
+        chunk={
+            "type": "content_block_start",
+            "index": 0,
+            "content_block": {
+                "type": "tool_use",
+                "id": "toolu_1",
+                "name": "get_time",
+                "input": {},
+            },
+        }
+    )
+    iterator.chunk_parser(
+        chunk={
+            "type": "content_block_delta",
+            "index": 0,
+            "delta": {"type": "input_json_delta", "partial_json": ""},
+        }
+    )
+    stop = iterator.chunk_parser(chunk={"type": "content_block_stop", "index": 0})
+
+    assert stop.choices[0].delta.tool_calls[0].function.arguments == "{}"
+
+
+def test_check_empty_tool_call_args_resets_per_block():
+    iterator = ModelResponseIterator(streaming_response=None, sync_stream=True)
+    assert iterator.check_empty_tool_call_args() is False
+
+    iterator.chunk_parser(
+        chunk={
+            "type": "content_block_start",
+            "index": 0,
+            "content_block": {"type": "text", "text": ""},
+        }
+    )
+    iterator.chunk_parser(chunk=TEXT_DELTA_CHUNK)
+    assert iterator.check_empty_tool_call_args() is False
+
+    iterator.chunk_parser(
+        chunk={
+            "type": "content_block_start",
+            "index": 1,
+            "content_block": {
+                "type": "tool_use",
+                "id": "toolu_1",
+                "name": "get_weather",
+                "input": {},
+            },
+        }
+    )
+    assert iterator.check_empty_tool_call_args() is False
+    iterator.chunk_parser(
+        chunk={
+            "type": "content_block_delta",
+            "index": 1,
+            "delta": {"type": "input_json_delta", "partial_json": ""},
+        }
+    )
+    assert iterator.check_empty_tool_call_args() is True
+    iterator.chunk_parser(
+        chunk={
+            "type": "content_block_delta",
+            "index": 1,
+            "delta": {"type": "input_json_delta", "partial_json": '{"a'},
+        }
+    )
+    assert iterator.check_empty_tool_call_args() is False
+
+
+@pytest.mark.parametrize(
+    "chunk",
+    [
+        {"type": "ping"},
+        {},
+        {
+            "type": "message_delta",
+            "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+            "usage": {"output_tokens": 10},
+        },
+    ],
+)
+def test_chunk_parser_chunks_without_index(chunk):
+    iterator = ModelResponseIterator(streaming_response=None, sync_stream=True)
+    parsed = iterator.chunk_parser(chunk=chunk)
+    assert parsed.choices[0].index == 0
+
+
+@pytest.mark.parametrize("json_mode", [True, False])
+def test_chunk_parser_json_mode_tool_delta(json_mode):
+    iterator = ModelResponseIterator(
+        streaming_response=None, sync_stream=True, json_mode=json_mode
+    )
+    parsed = iterator.chunk_parser(
+        chunk={
+            "type": "content_block_delta",
+            "index": 0,
+            "delta": {"type": "input_json_delta", "partial_json": '{"a": 1}'},
+        }
+    )
+    delta = parsed.choices[0].delta
+    if json_mode:
+        assert delta.content == '{"a": 1}'
+        assert delta.tool_calls is None
+    else:
+        assert delta.content == ""
+        assert delta.tool_calls[0].function.arguments == '{"a": 1}'
+
+
+def test_chunk_parser_message_start_and_delta_usage():
+    iterator = ModelResponseIterator(streaming_response=None, sync_stream=True)
+    start = iterator.chunk_parser(
+        chunk={
+            "type": "message_start",
+            "message": {
+                "id": "msg_1",
+                "type": "message",
+                "role": "assistant",
+                "content": [],
+                "usage": {"input_tokens": 270, "output_tokens": 1},
+            },
+        }
+    )
+    delta = iterator.chunk_parser(
+        chunk={
+            "type": "message_delta",
+            "delta": {"stop_reason": "max_tokens", "stop_sequence": None},
+            "usage": {"output_tokens": 10},
+        }
+    )
+
+    assert start.usage.prompt_tokens == 270
+    assert delta.usage.completion_tokens == 10
+    assert delta.choices[0].finish_reason == "length"
+
+
+def test_chunk_parser_error_chunk():
+    iterator = ModelResponseIterator(streaming_response=None, sync_stream=True)
+    with pytest.raises(AnthropicError, match="Overloaded"):
+        iterator.chunk_parser(
+            chunk={
+                "type": "error",
+                "error": {"type": "overloaded_error", "message": "Overloaded"},
+            }
+        )
+
+
+def test_handle_usage_cache_tokens():
+    iterator = ModelResponseIterator(streaming_response=None, sync_stream=True)
+    usage = iterator._handle_usage(
+        anthropic_usage_chunk={
+            "input_tokens": 3,
+            "output_tokens": 4,
+            "cache_creation_input_tokens": 5,
+            "cache_read_input_tokens": None,
+        }
+    )
+
+    assert usage.prompt_tokens == 3
+    assert usage.completion_tokens == 4
+    assert usage.total_tokens == 7
+    assert usage["cache_creation_input_tokens"] == 5
+    assert "cache_read_input_tokens" not in usage
+
+
+@pytest.mark.asyncio
+async def test_iterator_uses_slots():
+    async def _lines():
+        yield "data: " + json.dumps(TEXT_DELTA_CHUNK)
+
+    iterator = ModelResponseIterator(streaming_response=_lines(), sync_stream=False)
+    assert not hasattr(iterator, "__dict__")
+
+    chunks = [chunk async for chunk in iterator]
+    assert chunks[0].choices[0].delta.content == "Hellö"
+
+
+@pytest.mark.parametrize("chunk_type", list(ModelResponseIterator._CHUNK_HANDLERS))
+def test_chunk_handlers_resolve_to_methods(chunk_type):
+    handler_name = ModelResponseIterator._CHUNK_HANDLERS[chunk_type]
+    assert callable(getattr(ModelResponseIterator, handler_name))
@@ -33,3 +33,369 @@ def test_response_format_transformation_unit_test():
         "agent_doing": {"title": "Agent Doing", "type": "string"}
     }
     print(result)
+
+
+def test_get_anthropic_headers_cached_template_is_not_shared():
+    config = AnthropicConfig()
+
+    headers = config.get_anthropic_headers(
+        api_key="key-1",
+        prompt_caching_set=True,
+        user_anthropic_beta_headers=["custom-beta"],
+    )
+    assert headers["x-api-key"] == "key-1"
+    assert set(headers["anthropic-beta"].split(",")) == {
+        "prompt-caching-2024-07-31",
+        "custom-beta",
+    }
+
+    headers["anthropic-beta"] = "mutated"
+    headers_2 = config.get_anthropic_headers(
+        api_key="key-2",
+        prompt_caching_set=True,
+        user_anthropic_beta_headers=["custom-beta"],
+    )
+    assert headers_2["x-api-key"] == "key-2"
+    assert headers_2["anthropic-beta"] != "mutated"
+
+    vertex_headers = config.get_anthropic_headers(
+        api_key="key-1", prompt_caching_set=True, is_vertex_request=True
+    )
+    assert "anthropic-beta" not in vertex_headers
+
+
+@pytest.mark.parametrize(
+    "messages, tools",
+    [
+        ([{"role": "user", "content": "hi"}], None),
+        (
+            [
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": "hi",
+                            "cache_control": {"type": "ephemeral"},
+                        }
+                    ],
+                }
+            ],
+            None,
+        ),
+        (
+            [
+                {"role": "system", "content": "be nice", "cache_control": {}},
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": "summarize"},
+                        {"type": "file", "file": {"file_data": "data:..."}},
+                    ],
+                },
+            ],
+            [{"type": "computer_20241022", "name": "computer"}],
+        ),
+    ],
+)
+def test_scan_request_flags_matches_individual_checks(messages, tools):
+    config = AnthropicConfig()
+
+    assert config._scan_request_flags(messages=messages, tools=tools) == (
+        config.is_cache_control_set(messages=messages),
+        config.is_computer_tool_used(tools=tools),
+        config.is_pdf_used(messages=messages),
+    )
+
+
+def test_anthropic_config_init_sets_class_level_config():
+    from litellm.constants import DEFAULT_ANTHROPIC_CHAT_MAX_TOKENS
+
+    try:
+        AnthropicConfig(max_tokens=10, top_k=3)
+        config = AnthropicConfig.get_config()
+        assert config["max_tokens"] == 10
+        assert config["top_k"] == 3
+        assert "temperature" not in config
+    finally:
+        AnthropicConfig.top_k = None
+        AnthropicConfig(max_tokens=DEFAULT_ANTHROPIC_CHAT_MAX_TOKENS)
+
+
+def test_translate_system_message_removes_system_messages_in_place():
+    config = AnthropicConfig()
+    messages = [
+        {"role": "system", "content": "first"},
+        {"role": "user", "content": "hi"},
+        {"role": "system", "content": [{"type": "text", "text": "second"}]},
+        {"role": "assistant", "content": "hello"},
+        {"role": "system", "content": "third"},
+    ]
+    original_list = messages
+
+    system_messages = config.translate_system_message(messages=messages)
+
+    assert [m["text"] for m in system_messages] == ["first", "second", "third"]
+    assert messages is original_list
+    assert messages == [
+        {"role": "user", "content": "hi"},
+        {"role": "assistant", "content": "hello"},
+    ]
+
+
+def test_extract_response_content_joins_text_and_thinking_blocks():
+    config = AnthropicConfig()
+    completion_response = {
+        "content": [
+            {"type": "thinking", "thinking": "step 1. ", "signature": "sig"},
+            {"type": "thinking", "thinking": "step 2.", "signature": "sig"},
+            {"type": "text", "text": "Hello"},
+            {
+                "type": "tool_use",
+                "id": "toolu_1",
+                "name": "get_weather",
+                "input": {"location": "Boston"},
+            },
+            {"type": "text", "text": " world"},
+        ]
+    }
+
+    (
+        text_content,
+        citations,
+        thinking_blocks,
+        reasoning_content,
+        tool_calls,
+    ) = config.extract_response_content(completion_response=completion_response)
+
+    assert text_content == "Hello world"
+    assert citations is None
+    assert thinking_blocks is not None and len(thinking_blocks) == 2
+    assert reasoning_content == "step 1. step 2."
+    assert len(tool_calls) == 1
+    assert tool_calls[0]["index"] == 3
+    assert json.loads(tool_calls[0]["function"]["arguments"]) == {
+        "location": "Boston"
+    }
+
+
+def test_map_openai_params_dispatch():
+    config = AnthropicConfig()
+
+    optional_params = config.map_openai_params(
+        non_default_params={
+            "max_completion_tokens": 100,
+            "temperature": 0.2,
+            "stream": False,
+            "stop": ["END"],
+            "user": "user-1",
+            "tool_choice": "required",
+            "parallel_tool_calls": False,
+            "unknown_param": "ignored",
+        },
+        optional_params={},
+        model="claude-3-5-sonnet-20240620",
+        drop_params=False,
+    )
+
+    assert optional_params == {
+        "max_tokens": 100,
+        "temperature": 0.2,
+        "stop_sequences": ["END"],
+        "metadata": {"user_id": "user-1"},
+        "tool_choice": {"type": "any", "disable_parallel_tool_use": True},
+    }
+
+
+def test_map_openai_params_parallel_tool_calls_only():
+    config = AnthropicConfig()
+
+    optional_params = config.map_openai_params(
+        non_default_params={"parallel_tool_calls": True},
+        optional_params={},
+        model="claude-3-5-sonnet-20240620",
+        drop_params=False,
+    )
+
+    assert optional_params["tool_choice"] == {
+        "type": "auto",
+        "disable_parallel_tool_use": False,
+    }
+
+
+def test_map_openai_params_tool_choice_kept_after_response_format():
+    config = AnthropicConfig()
+
+    # 'parallel_tool_calls' re-applies the user's tool_choice after response_format
+    # set the json tool as tool_choice
+    optional_params = config.map_openai_params(
+        non_default_params={
+            "tool_choice": "required",
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {"schema": {"type": "object", "properties": {}}},
+            },
+            "parallel_tool_calls": False,
+        },
+        optional_params={},
+        model="claude-3-5-sonnet-20240620",
+        drop_params=False,
+    )
+
+    assert optional_params["tool_choice"] == {
+        "type": "any",
+        "disable_parallel_tool_use": True,
+    }
+
+
+def test_get_config_only_returns_request_params():
+    config = AnthropicConfig.get_config()
+    assert all(not k.startswith("_") for k in config)
+    json.dumps(config)
+
+
+def test_cached_config_tracks_class_attribute_changes():
+    assert AnthropicConfig._get_cached_config() == AnthropicConfig.get_config()
+    assert AnthropicConfig._get_cached_config() is AnthropicConfig._get_cached_config()
+
+    try:
+        AnthropicConfig.top_k = 5
+        assert AnthropicConfig._get_cached_config()["top_k"] == 5
+    finally:
+        AnthropicConfig.top_k = None
+    assert "top_k" not in AnthropicConfig._get_cached_config()
+
+
+def test_map_tool_helper_hosted_and_computer_tools():
+    config = AnthropicConfig()
+
+    computer_tool = config._map_tool_helper(
+        {
+            "type": "computer_20241022",
+            "function": {
+                "name": "computer",
+                "parameters": {
+                    "display_height_px": 100,
+                    "display_width_px": 200,
+                    "display_number": 1,
+                },
+                "cache_control": {"type": "ephemeral"},
+            },
+        }
+    )
+    assert computer_tool == {
+        "type": "computer_20241022",
+        "name": "computer",
+        "display_width_px": 200,
+        "display_height_px": 100,
+        "display_number": 1,
+        "cache_control": {"type": "ephemeral"},
+    }
+
+    bash_tool = config._map_tool_helper(
+        {"type": "bash_20241022", "function": {"name": "bash"}}
+    )
+    assert bash_tool == {"type": "bash_20241022", "name": "bash"}
+
+    with pytest.raises(ValueError, match="display_width_px"):
+        config._map_tool_helper(
+            {"type": "computer_20241022", "function": {"parameters": {}}}
+        )
+
+
+def test_get_anthropic_headers_beta_order_is_deterministic():
+    headers = AnthropicConfig().get_anthropic_headers(
+        api_key="fake-api-key",
+        computer_tool_used=True,
+        prompt_caching_set=True,
+        pdf_used=True,
+        user_anthropic_beta_headers=["pdfs-2024-09-25", "custom-beta"],
+    )
+    assert headers["anthropic-beta"] == (
+        "prompt-caching-2024-07-31,computer-use-2024-10-22,pdfs-2024-09-25,custom-beta"
+    )
+
+
+@pytest.mark.parametrize(
+    "drop_params, stop, expected",
+    [
+        (False, "\n", ["\n"]),
+        (True, "\n", None),
+        (True, "END", ["END"]),
+        (True, ["\n", "END", " "], ["END"]),
+        (True, ["\n"], None),
+        (False, ["\n", "END"], ["\n", "END"]),
+        (True, None, None),
+    ],
+)
+def test_map_stop_sequences(monkeypatch, drop_params, stop, expected):
+    import litellm
+
+    monkeypatch.setattr(litellm, "drop_params", drop_params)
+    assert AnthropicConfig()._map_stop_sequences(stop) == expected
+
+
+def test_translate_system_message_without_system_messages():
+    messages = [
+        {"role": "user", "content": "hi"},
+        {"role": "assistant", "content": "hello"},
+    ]
+    original_messages = list(messages)
+
+    assert AnthropicConfig().translate_system_message(messages=messages) == []
+    assert messages == original_messages
+
+
+def test_create_json_tool_call_for_response_format_without_schema():
+    config = AnthropicConfig()
+
+    tool = config._create_json_tool_call_for_response_format(json_schema=None)
+    assert tool == {
+        "name": "json_tool_call",
+        "input_schema": {
+            "type": "object",
+            "additionalProperties": True,
+            "properties": {},
+        },
+    }
+
+    # each call returns a fresh dict
+    tool["input_schema"]["properties"]["mutated"] = {}
+    assert config._create_json_tool_call_for_response_format()["input_schema"][
+        "properties"
+    ] == {}
+
+
+@pytest.mark.parametrize("prompt_caching_set", [True, False])
+@pytest.mark.parametrize("computer_tool_used", [True, False])
+@pytest.mark.parametrize("pdf_used", [True, False])
+def test_get_anthropic_headers_default_fast_path(
+    prompt_caching_set, computer_tool_used, pdf_used
+):
+    from litellm.llms.anthropic.chat.transformation import (
+        _get_anthropic_header_template,
+    )
+
+    headers = AnthropicConfig().get_anthropic_headers(
+        api_key="fake-api-key",
+        prompt_caching_set=prompt_caching_set,
+        computer_tool_used=computer_tool_used,
+        pdf_used=pdf_used,
+    )
+    expected_headers = {
+        "x-api-key": "fake-api-key",
+        **dict(
+            _get_anthropic_header_template(
+                anthropic_version=None,
+                computer_tool_used=computer_tool_used,
+                prompt_caching_set=prompt_caching_set,
+                pdf_used=pdf_used,
+                is_vertex_request=False,
+                user_anthropic_beta_headers=None,
+            )
+        ),
+    }
+    assert headers == expected_headers
+    assert ("anthropic-beta" in headers) == any(
+        [prompt_caching_set, computer_tool_used, pdf_used]
+    )
@@ -2,6 +2,8 @@ import json
 import os
 import sys
 
+from typing import Optional
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -45,3 +47,130 @@ def test_transform_choices():
     assert choices[0].message.reasoning_content == "i'm thinking."
     assert choices[0].message.thinking_blocks is not None
     assert choices[0].message.tool_calls is None
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        None,
+        "hello",
+        [{"type": "text", "text": "a"}, {"type": "text", "text": "b"}],
+        [{"type": "reasoning", "summary": []}, {"type": "text", "text": "a"}],
+        [
+            {
+                "type": "reasoning",
+                "summary": [
+                    {"type": "summary_text", "text": "one ", "signature": "s1"},
+                    {"type": "summary_text", "text": "two", "signature": "s2"},
+                ],
+            },
+            {"type": "text", "text": "answer"},
+        ],
+    ],
+)
+def test_extract_content_and_reasoning_matches_separate_helpers(content):
+    content_str, reasoning_content, thinking_blocks = (
+        DatabricksConfig._extract_content_and_reasoning(content)
+    )
+
+    assert content_str == DatabricksConfig.extract_content_str(content)
+    assert (reasoning_content, thinking_blocks) == (
+        DatabricksConfig.extract_reasoning_content(content)
+    )
+
+
+def test_transform_messages_dumps_pydantic_messages():
+    from pydantic import BaseModel
+
+    class PydanticMessage(BaseModel):
+        role: str
+        content: str
+        name: Optional[str] = None
+
+    config = DatabricksConfig()
+    messages = [
+        PydanticMessage(role="user", content="hi"),
+        {
+            "role": "assistant",
+            "name": "bob",
+            "content": [{"type": "text", "text": "hey"}],
+        },
+    ]
+
+    transformed = config._transform_messages(messages=messages, model="dbrx")  # type: ignore
+
+    assert transformed == [
+        {"role": "user", "content": "hi"},
+        {"role": "assistant", "content": "hey"},
+    ]
+
+
+def test_chunk_parser_json_mode_tool_call_to_content():
+    from litellm.constants import RESPONSE_FORMAT_TOOL_NAME
+    from litellm.llms.databricks.chat.transformation import (
+        DatabricksChatResponseIterator,
+    )
+
+    iterator = DatabricksChatResponseIterator(
+        streaming_response=None, sync_stream=True, json_mode=True
+    )
+
+    def _chunk(function: dict) -> dict:
+        return {
+            "id": "chatcmpl-1",
+            "created": 1,
+            "model": "databricks-claude",
+            "choices": [
+                {
+                    "index": 0,
+                    "delta": {
+                        "role": "assistant",
+                        "content": None,
+                        "tool_calls": [
+                            {"index": 0, "type": "function", "function": function}
+                        ],
+                    },
+                }
+            ],
+        }
+
+    first = iterator.chunk_parser(
+        chunk=_chunk({"name": RESPONSE_FORMAT_TOOL_NAME, "arguments": ""})
+    )
+    second = iterator.chunk_parser(chunk=_chunk({"arguments": '{"a": 1}'}))
+
+    assert first.choices[0].delta.tool_calls is None
+    assert second.choices[0].delta.content == '{"a": 1}'
+    assert second.choices[0].delta.tool_calls is None
+
+
+def test_chunk_parser_does_not_mutate_raw_chunk():
+    import copy
+
+    from litellm.llms.databricks.chat.transformation import (
+        DatabricksChatResponseIterator,
+    )
+
+    chunk = {
+        "id": "chatcmpl-1",
+        "created": 1,
+        "model": "databricks-claude",
+        "choices": [
+            {
+                "index": 0,
+                "delta": {
+                    "role": "assistant",
+                    "content": [{"type": "text", "text": "hi"}],
+                },
+            }
+        ],
+    }
+    raw_chunk = copy.deepcopy(chunk)
+    iterator = DatabricksChatResponseIterator(
+        streaming_response=None, sync_stream=True
+    )
+
+    parsed = iterator.chunk_parser(chunk=chunk)
+
+    assert parsed.choices[0].delta.content == "hi"
+    assert chunk == raw_chunk
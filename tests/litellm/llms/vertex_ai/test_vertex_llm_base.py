@@ -11,7 +11,8 @@ sys.path.insert(
 )  # Adds the parent directory to the system path
 
 import litellm
-from litellm.llms.vertex_ai.vertex_llm_base import VertexBase
+from litellm.litellm_core_utils.asyncify import asyncify
+from litellm.llms.vertex_ai.vertex_llm_base import VertexBase, _get_auth_request
 
 
 def run_sync(coro):
@@ -21,6 +22,22 @@ def run_sync(coro):
     return asyncio.run(coro)
 
 
+@pytest.fixture(autouse=True)
+def clear_shared_credentials():
+    # loaded credentials (and their tokens / locks) are shared across VertexBase instances
+    shared_state = (
+        VertexBase._credentials_project_mapping,
+        VertexBase._access_token_cache,
+        VertexBase._credential_locks,
+        VertexBase._async_credential_locks,
+    )
+    for state in shared_state:
+        state.clear()
+    yield
+    for state in shared_state:
+        state.clear()
+
+
 class TestVertexBase:
     @pytest.mark.parametrize("is_async", [True, False], ids=["async", "sync"])
     @pytest.mark.asyncio
@@ -174,3 +191,385 @@ class TestVertexBase:
             )
         assert token == ""
         assert project == ""
+
+    @pytest.mark.parametrize("is_async", [True, False], ids=["async", "sync"])
+    @pytest.mark.asyncio
+    async def test_access_token_cache(self, is_async):
+        from datetime import datetime, timedelta
+
+        vertex_base = VertexBase()
+
+        mock_creds = MagicMock()
+        mock_creds.token = "token-1"
+        mock_creds.expired = False
+        mock_creds.project_id = "project-1"
+        mock_creds.quota_project_id = "project-1"
+        mock_creds.expiry = datetime.utcnow() + timedelta(hours=1)
+
+        async def _get_token():
+            if is_async:
+                return await vertex_base._ensure_access_token_async(
+                    credentials={"type": "service_account"},
+                    project_id="project-1",
+                    custom_llm_provider="vertex_ai",
+                )
+            return vertex_base._ensure_access_token(
+                credentials={"type": "service_account"},
+                project_id="project-1",
+                custom_llm_provider="vertex_ai",
+            )
+
+        with patch.object(
+            vertex_base, "load_auth", return_value=(mock_creds, "project-1")
+        ) as mock_load_auth:
+            assert await _get_token() == ("token-1", "project-1")
+
+            # token is cached - credentials are not touched again
+            mock_creds.token = "token-2"
+            with patch.object(
+                vertex_base, "_credentials_project_mapping", new={}
+            ), patch(
+                "litellm.llms.vertex_ai.vertex_llm_base.asyncify"
+            ) as mock_asyncify:
+                assert await _get_token() == ("token-1", "project-1")
+                mock_asyncify.assert_not_called()
+            assert mock_load_auth.call_count == 1
+
+            # token about to expire - credentials are checked again
+            mock_creds.expiry = datetime.utcnow() + timedelta(minutes=1)
+            vertex_base._access_token_cache.clear()
+            assert await _get_token() == ("token-2", "project-1")
+            assert await _get_token() == ("token-2", "project-1")
+            credential_cache_key = vertex_base._get_credential_cache_key(
+                credentials={"type": "service_account"}, project_id="project-1"
+            )
+            assert vertex_base._get_cached_access_token(credential_cache_key) is None
+
+    def test_concurrent_refresh_is_single_flight(self):
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        vertex_base = VertexBase()
+
+        mock_creds = MagicMock()
+        mock_creds.token = "expired-token"
+        mock_creds.expired = True
+        mock_creds.project_id = "project-1"
+        mock_creds.quota_project_id = "project-1"
+        vertex_base._credentials_project_mapping[
+            vertex_base._get_credential_cache_key(
+                credentials={"type": "service_account"}, project_id="project-1"
+            )
+        ] = mock_creds
+
+        refresh_calls = []
+        barrier = threading.Barrier(4)
+
+        def mock_refresh_impl(creds):
+            refresh_calls.append(creds)
+            time.sleep(0.1)
+            creds.token = "refreshed-token"
+            creds.expired = False
+
+        def _get_token():
+            barrier.wait()
+            return vertex_base.get_access_token(
+                credentials={"type": "service_account"}, project_id="project-1"
+            )
+
+        with patch.object(vertex_base, "refresh_auth", side_effect=mock_refresh_impl):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(executor.map(lambda _: _get_token(), range(4)))
+
+        assert len(refresh_calls) == 1
+        assert results == [("refreshed-token", "project-1")] * 4
+
+    def test_concurrent_refresh_is_single_flight_across_instances(self):
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        vertex_bases = [VertexBase(), VertexBase()]
+
+        mock_creds = MagicMock()
+        mock_creds.token = "expired-token"
+        mock_creds.expired = True
+        mock_creds.project_id = "project-1"
+        mock_creds.quota_project_id = "project-1"
+        VertexBase._credentials_project_mapping[
+            VertexBase._get_credential_cache_key(
+                credentials={"type": "service_account"}, project_id="project-1"
+            )
+        ] = mock_creds
+
+        refresh_calls = []
+        barrier = threading.Barrier(4)
+
+        def mock_refresh_impl(creds):
+            refresh_calls.append(creds)
+            time.sleep(0.1)
+            creds.token = "refreshed-token"
+            creds.expired = False
+
+        def _get_token(idx):
+            barrier.wait()
+            return vertex_bases[idx % 2].get_access_token(
+                credentials={"type": "service_account"}, project_id="project-1"
+            )
+
+        with patch.object(VertexBase, "refresh_auth", side_effect=mock_refresh_impl):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(executor.map(_get_token, range(4)))
+
+        assert len(refresh_calls) == 1
+        assert results == [("refreshed-token", "project-1")] * 4
+
+    @pytest.mark.asyncio
+    async def test_async_concurrent_load_is_single_flight(self):
+        import asyncio
+        from datetime import datetime, timedelta
+
+        vertex_base = VertexBase()
+
+        mock_creds = MagicMock()
+        mock_creds.token = "token-1"
+        mock_creds.expired = False
+        mock_creds.project_id = "project-1"
+        mock_creds.quota_project_id = "project-1"
+        mock_creds.expiry = datetime.utcnow() + timedelta(hours=1)
+
+        with patch.object(
+            vertex_base, "load_auth", return_value=(mock_creds, "project-1")
+        ), patch(
+            "litellm.llms.vertex_ai.vertex_llm_base.asyncify",
+            wraps=asyncify,
+        ) as mock_asyncify:
+            results = await asyncio.gather(
+                *[
+                    vertex_base._ensure_access_token_async(
+                        credentials={"type": "service_account"},
+                        project_id="project-1",
+                        custom_llm_provider="vertex_ai",
+                    )
+                    for _ in range(4)
+                ]
+            )
+
+        assert results == [("token-1", "project-1")] * 4
+        assert mock_asyncify.call_count == 1
+
+    def test_background_refresh_near_expiry(self):
+        from datetime import datetime, timedelta
+
+        vertex_base = VertexBase()
+
+        mock_creds = MagicMock()
+        mock_creds.token = "token-1"
+        mock_creds.expired = False
+        mock_creds.project_id = "project-1"
+        mock_creds.quota_project_id = "project-1"
+        mock_creds.expiry = datetime.utcnow() + timedelta(minutes=4)
+
+        def mock_refresh_impl(creds):
+            creds.token = "token-2"
+            creds.expiry = datetime.utcnow() + timedelta(hours=1)
+
+        with patch.object(
+            vertex_base, "load_auth", return_value=(mock_creds, "project-1")
+        ), patch.object(
+            vertex_base, "refresh_auth", side_effect=mock_refresh_impl
+        ) as mock_refresh, patch(
+            "litellm.llms.vertex_ai.vertex_llm_base.executor"
+        ) as mock_executor:
+            mock_executor.submit.side_effect = lambda fn, *args: fn(*args)
+
+            # first call loads the credentials and caches the near-expiry token
+            assert vertex_base.get_access_token(
+                credentials=None, project_id="project-1"
+            ) == ("token-1", "project-1")
+            mock_refresh.assert_not_called()
+
+            # cached token is still served, while it is refreshed in the background
+            assert vertex_base.get_access_token(
+                credentials=None, project_id="project-1"
+            ) == ("token-1", "project-1")
+            assert mock_executor.submit.call_count == 1
+            mock_refresh.assert_called_once_with(mock_creds)
+
+            assert vertex_base.get_access_token(
+                credentials=None, project_id="project-1"
+            ) == ("token-2", "project-1")
+            assert mock_executor.submit.call_count == 1
+
+    def test_credential_cache_key(self):
+        credentials = {"type": "service_account", "private_key": "x" * 2048}
+        key = VertexBase._get_credential_cache_key(
+            credentials=credentials, project_id="project-1"
+        )
+
+        assert key == VertexBase._get_credential_cache_key(
+            credentials=dict(reversed(list(credentials.items()))),
+            project_id="project-1",
+        )
+        assert key != VertexBase._get_credential_cache_key(
+            credentials=credentials, project_id="project-2"
+        )
+        assert len(key[0]) == 32
+        assert VertexBase._get_credential_cache_key(
+            credentials="/path/to/creds.json", project_id=None
+        ) == ("/path/to/creds.json", None)
+
+    def test_load_auth_closes_credentials_file(self, tmp_path):
+        credentials_file = tmp_path / "creds.json"
+        credentials_file.write_text('{"type": "service_account"}')
+        mock_google_auth = MagicMock()
+        opened_files = []
+        builtin_open = open
+
+        def _recording_open(*args, **kwargs):
+            opened_file = builtin_open(*args, **kwargs)
+            opened_files.append(opened_file)
+            return opened_file
+
+        with patch.dict(
+            sys.modules,
+            {
+                "google": mock_google_auth,
+                "google.auth": mock_google_auth.auth,
+                "google.auth.transport": mock_google_auth.auth.transport,
+                "google.auth.transport.requests": mock_google_auth.auth.transport.requests,
+                "google.oauth2": mock_google_auth.oauth2,
+                "google.oauth2.service_account": mock_google_auth.oauth2.service_account,
+            },
+        ), patch("builtins.open", side_effect=_recording_open):
+            _get_auth_request.cache_clear()
+            VertexBase().load_auth(
+                credentials=str(credentials_file), project_id="project-1"
+            )
+        _get_auth_request.cache_clear()
+
+        assert len(opened_files) == 1
+        assert opened_files[0].closed
+        mock_google_auth.oauth2.service_account.Credentials.from_service_account_info.assert_called_once()
+
+    def test_refresh_auth_reuses_transport_request(self):
+        mock_requests_module = MagicMock()
+        credentials = MagicMock()
+
+        with patch.dict(
+            sys.modules,
+            {"google.auth.transport.requests": mock_requests_module},
+        ):
+            _get_auth_request.cache_clear()
+            VertexBase().refresh_auth(credentials)
+            VertexBase().refresh_auth(credentials)
+        _get_auth_request.cache_clear()
+
+        assert mock_requests_module.Request.call_count == 1
+        assert credentials.refresh.call_args_list == [
+            call(mock_requests_module.Request.return_value)
+        ] * 2
+
+    @pytest.mark.parametrize(
+        "custom_llm_provider, stream, expected_url, expected_auth_header",
+        [
+            ("vertex_ai", None, "https://proxy:generateContent", "token"),
+            ("vertex_ai", True, "https://proxy:generateContent?alt=sse", "token"),
+            ("gemini", False, "https://proxy:generateContent", "gemini-key"),
+            ("gemini", True, "https://proxy:generateContent?alt=sse", "gemini-key"),
+        ],
+    )
+    def test_check_custom_proxy(
+        self, custom_llm_provider, stream, expected_url, expected_auth_header
+    ):
+        vertex_base = VertexBase()
+        for _ in range(2):  # second call is served from the url cache
+            auth_header, url = vertex_base._check_custom_proxy(
+                api_base="https://proxy",
+                custom_llm_provider=custom_llm_provider,
+                gemini_api_key="gemini-key",
+                endpoint="generateContent",
+                stream=stream,
+                auth_header="token",
+                url="https://default",
+            )
+            assert url == expected_url
+            assert auth_header == expected_auth_header
+
+        assert vertex_base._check_custom_proxy(
+            api_base=None,
+            custom_llm_provider=custom_llm_provider,
+            gemini_api_key="gemini-key",
+            endpoint="generateContent",
+            stream=stream,
+            auth_header="token",
+            url="https://default",
+        ) == ("token", "https://default")
+
+    def test_background_refresh_shared_across_instances(self):
+        from datetime import datetime, timedelta
+
+        vertex_base_1, vertex_base_2 = VertexBase(), VertexBase()
+
+        mock_creds = MagicMock()
+        mock_creds.token = "token-1"
+        mock_creds.expired = False
+        mock_creds.project_id = "project-1"
+        mock_creds.quota_project_id = "project-1"
+        mock_creds.expiry = datetime.utcnow() + timedelta(minutes=4)
+
+        def mock_refresh_impl(creds):
+            creds.token = "token-2"
+            creds.expiry = datetime.utcnow() + timedelta(hours=1)
+
+        with patch.object(
+            VertexBase, "load_auth", return_value=(mock_creds, "project-1")
+        ), patch.object(
+            VertexBase, "refresh_auth", side_effect=mock_refresh_impl
+        ) as mock_refresh, patch(
+            "litellm.llms.vertex_ai.vertex_llm_base.executor"
+        ) as mock_executor:
+            mock_executor.submit.side_effect = lambda fn, *args: fn(*args)
+
+            # the token loaded by one instance is a cache hit for the other, which
+            # refreshes it in the background
+            for vertex_base in (vertex_base_1, vertex_base_2):
+                assert vertex_base.get_access_token(
+                    credentials=None, project_id="project-1"
+                ) == ("token-1", "project-1")
+            mock_refresh.assert_called_once_with(mock_creds)
+
+            # both instances see the refreshed token - no refresh of their own
+            for vertex_base in (vertex_base_1, vertex_base_2):
+                assert vertex_base.get_access_token(
+                    credentials=None, project_id="project-1"
+                ) == ("token-2", "project-1")
+            assert mock_executor.submit.call_count == 1
+            mock_refresh.assert_called_once()
+
+    def test_vertex_base_slots(self):
+        vertex_base = VertexBase()
+        assert "project_id" in VertexBase.__slots__
+        assert "project_id" not in vertex_base.__dict__
+        assert vertex_base.project_id is None
+
+    def test_credentials_shared_across_instances(self):
+        from datetime import datetime, timedelta
+
+        mock_creds = MagicMock()
+        mock_creds.token = "token-1"
+        mock_creds.expired = False
+        mock_creds.project_id = "project-1"
+        mock_creds.quota_project_id = "project-1"
+        mock_creds.expiry = datetime.utcnow() + timedelta(hours=1)
+
+        with patch.object(
+            VertexBase, "load_auth", return_value=(mock_creds, "project-1")
+        ) as mock_load_auth:
+            for _ in range(3):
+                assert VertexBase().get_access_token(
+                    credentials={"type": "service_account"}, project_id="project-1"
+                ) == ("token-1", "project-1")
+
+        assert mock_load_auth.call_count == 1
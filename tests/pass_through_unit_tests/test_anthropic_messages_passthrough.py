@@ -1,8 +1,9 @@
 import json
 import os
+import re
 import sys
 from datetime import datetime
-from typing import AsyncIterator, Dict, Any
+from typing import Any, AsyncIterator, Callable, Dict, List
 import asyncio
 import unittest.mock
 from unittest.mock import AsyncMock, MagicMock
@@ -12,6 +13,7 @@ sys.path.insert(
 )  # Adds the parent directory to the system path
 import litellm
 import pytest
+import pytest_asyncio
 from dotenv import load_dotenv
 from litellm.llms.anthropic.experimental_pass_through.messages.handler import (
     anthropic_messages,
@@ -20,6 +22,7 @@ from litellm.llms.anthropic.experimental_pass_through.messages.handler import (
 from typing import Optional
 from litellm.types.utils import StandardLoggingPayload
 from litellm.integrations.custom_logger import CustomLogger
+from litellm.litellm_core_utils.fast_json import fast_json_loads
 from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler
 from litellm.router import Router
 import importlib
@@ -27,6 +30,25 @@ import importlib
 # Load environment variables
 load_dotenv()
 
+# `data: {...}` lines of a raw SSE chunk, matched on bytes so chunks don't need decoding
+_SSE_DATA_RE = re.compile(rb"^data: (.+)$", re.MULTILINE)
+
+_API_KEY = os.getenv("ANTHROPIC_API_KEY")
+_JOKE_MESSAGES = ({"role": "user", "content": "Hello, can you tell me a short joke?"},)
+
+
+def _joke_messages() -> List[Dict[str, str]]:
+    """
+    Fresh copy of `_JOKE_MESSAGES` per request, so in-place edits by litellm can't leak into other tests
+    """
+    return [dict(message) for message in _JOKE_MESSAGES]
+
+
+# for the tests that call the live Anthropic API
+requires_anthropic_api_key = pytest.mark.skipif(
+    not _API_KEY, reason="ANTHROPIC_API_KEY not found in environment"
+)
+
 
 @pytest.fixture(scope="session")
 def event_loop():
@@ -36,6 +58,16 @@ def event_loop():
     loop.close()
 
 
+@pytest_asyncio.fixture(scope="session")
+async def shared_http_client():
+    """
+    One AsyncHTTPHandler for the live Anthropic tests, so the connection to api.anthropic.com is reused instead of re-doing the TLS handshake per test.
+    """
+    client = AsyncHTTPHandler()
+    yield client
+    await client.close()
+
+
 @pytest.fixture(scope="function", autouse=True)
 def setup_and_teardown(event_loop):  # Add event_loop as a dependency
     curr_dir = os.getcwd()
@@ -69,67 +101,89 @@ def _validate_anthropic_response(response: Dict[str, Any]):
     assert response["role"] == "assistant"
 
 
-@pytest.mark.asyncio
-async def test_anthropic_messages_non_streaming():
+def _usage_from_sse_bytes(chunk: bytes) -> List[Any]:
     """
-    Test the anthropic_messages with non-streaming request
+    Usage blocks from the `data: {...}` lines of a raw SSE chunk
     """
-    litellm._turn_on_debug()
-    # Get API key from environment
-    api_key = os.getenv("ANTHROPIC_API_KEY")
-    if not api_key:
-        pytest.skip("ANTHROPIC_API_KEY not found in environment")
+    usage_blocks: List[Any] = []
+    for match in _SSE_DATA_RE.finditer(chunk):
+        try:
+            json_data = fast_json_loads(match.group(1))
+        except json.JSONDecodeError:
+            print(f"Failed to parse JSON from: {match.group(1)!r}")
+            continue
+        print("\n\nJSON data:", json.dumps(json_data, indent=4, default=str))
+
+        if json_data.get("type") == "message_start" and "message" in json_data:
+            if "usage" in json_data["message"]:
+                usage_blocks.append(json_data["message"]["usage"])
+        elif "usage" in json_data:
+            usage_blocks.append(json_data["usage"])
+    return usage_blocks
+
+
+def _usage_from_chunk_attrs(chunk: Any) -> List[Any]:
+    """
+    Usage block of an already parsed chunk object, if it carries one
+    """
+    message = getattr(chunk, "message", None)
+    if message is not None:
+        return [message.usage] if message.usage else []
+    usage = getattr(chunk, "usage", None)
+    return [usage] if usage is not None else []
 
-    # Set up test parameters
-    messages = [{"role": "user", "content": "Hello, can you tell me a short joke?"}]
 
-    # Call the handler
-    response = await litellm.anthropic.messages.acreate(
-        messages=messages,
-        api_key=api_key,
+async def _run_non_streaming(client: AsyncHTTPHandler) -> Dict[str, Any]:
+    return await litellm.anthropic.messages.acreate(
+        messages=_joke_messages(),
+        api_key=_API_KEY,
         model="claude-3-haiku-20240307",
         max_tokens=100,
+        client=client,
     )
 
-    # Verify response
-    assert "id" in response
-    assert "content" in response
-    assert "model" in response
-    assert response["role"] == "assistant"
-
-    print(f"Non-streaming response: {json.dumps(response, indent=2)}")
-    return response
-
-
-@pytest.mark.asyncio
-async def test_anthropic_messages_streaming():
-    """
-    Test the anthropic_messages with streaming request
-    """
-    # Get API key from environment
-    api_key = os.getenv("ANTHROPIC_API_KEY")
-    if not api_key:
-        pytest.skip("ANTHROPIC_API_KEY not found in environment")
 
-    # Set up test parameters
-    messages = [{"role": "user", "content": "Hello, can you tell me a short joke?"}]
-
-    # Call the handler
-    async_httpx_client = AsyncHTTPHandler()
+async def _run_streaming(client: AsyncHTTPHandler) -> List[Any]:
     response = await litellm.anthropic.messages.acreate(
-        messages=messages,
-        api_key=api_key,
+        messages=_joke_messages(),
+        api_key=_API_KEY,
         model="claude-3-haiku-20240307",
         max_tokens=100,
         stream=True,
-        client=async_httpx_client,
+        client=client,
     )
+    if not isinstance(response, AsyncIterator):
+        return []
+    return [chunk async for chunk in response]
 
-    if isinstance(response, AsyncIterator):
-        async for chunk in response:
-            print("chunk=", chunk)
+
+async def _run_router_non_streaming(client: AsyncHTTPHandler) -> Dict[str, Any]:
+    router = Router(
+        model_list=[
+            {
+                "model_name": "claude-special-alias",
+                "litellm_params": {
+                    "model": "claude-3-haiku-20240307",
+                    "api_key": _API_KEY,
+                },
+            }
+        ]
+    )
+    return await router.aanthropic_messages(
+        messages=_joke_messages(),
+        model="claude-special-alias",
+        max_tokens=100,
+        client=client,
+    )
 
 
+# chunk type -> usage extractor, anything else falls back to `_usage_from_chunk_attrs`
+_USAGE_EXTRACTORS: Dict[type, Callable[[Any], List[Any]]] = {
+    bytes: _usage_from_sse_bytes,
+}
+
+
+@requires_anthropic_api_key
 @pytest.mark.asyncio
 async def test_anthropic_messages_streaming_with_bad_request():
     """
@@ -138,7 +192,7 @@ async def test_anthropic_messages_streaming_with_bad_request():
     try:
         response = await litellm.anthropic.messages.acreate(
             messages=["hi"],
-            api_key=os.getenv("ANTHROPIC_API_KEY"),
+            api_key=_API_KEY,
             model="claude-3-haiku-20240307",
             max_tokens=100,
             stream=True,
@@ -152,6 +206,7 @@ async def test_anthropic_messages_streaming_with_bad_request():
         assert e.status_code == 400
 
 
+@requires_anthropic_api_key
 @pytest.mark.asyncio
 async def test_anthropic_messages_router_streaming_with_bad_request():
     """
@@ -164,7 +219,7 @@ async def test_anthropic_messages_router_streaming_with_bad_request():
                     "model_name": "claude-special-alias",
                     "litellm_params": {
                         "model": "claude-3-haiku-20240307",
-                        "api_key": os.getenv("ANTHROPIC_API_KEY"),
+                        "api_key": _API_KEY,
                     },
                 }
             ]
@@ -185,56 +240,38 @@ async def test_anthropic_messages_router_streaming_with_bad_request():
         assert e.status_code == 400
 
 
+@requires_anthropic_api_key
 @pytest.mark.asyncio
-async def test_anthropic_messages_litellm_router_non_streaming():
-    """
-    Test the anthropic_messages with non-streaming request
+async def test_anthropic_messages_concurrent(shared_http_client):
     """
-    litellm._turn_on_debug()
-    router = Router(
-        model_list=[
-            {
-                "model_name": "claude-special-alias",
-                "litellm_params": {
-                    "model": "claude-3-haiku-20240307",
-                    "api_key": os.getenv("ANTHROPIC_API_KEY"),
-                },
-            }
-        ]
-    )
-
-    # Set up test parameters
-    messages = [{"role": "user", "content": "Hello, can you tell me a short joke?"}]
+    Test anthropic_messages non-streaming + streaming requests, direct and through the router
 
-    # Call the handler
-    response = await router.aanthropic_messages(
-        messages=messages,
-        model="claude-special-alias",
-        max_tokens=100,
+    The requests are independent, so they are sent concurrently - wall time is the slowest request instead of their sum
+    """
+    non_streaming, streaming_chunks, router_non_streaming = await asyncio.gather(
+        _run_non_streaming(client=shared_http_client),
+        _run_streaming(client=shared_http_client),
+        _run_router_non_streaming(client=shared_http_client),
     )
 
-    # Verify response
-    assert "id" in response
-    assert "content" in response
-    assert "model" in response
-    assert response["role"] == "assistant"
-
-    print(f"Non-streaming response: {json.dumps(response, indent=2)}")
-    return response
+    _validate_anthropic_response(non_streaming)
+    assert len(streaming_chunks) > 0
+    _validate_anthropic_response(router_non_streaming)
 
 
 class TestCustomLogger(CustomLogger):
     def __init__(self):
         super().__init__()
         self.logged_standard_logging_payload: Optional[StandardLoggingPayload] = None
+        self.log_received = asyncio.Event()
 
     async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
         print("inside async_log_success_event")
         self.logged_standard_logging_payload = kwargs.get("standard_logging_object")
-
-        pass
+        self.log_received.set()
 
 
+@requires_anthropic_api_key
 @pytest.mark.asyncio
 async def test_anthropic_messages_litellm_router_non_streaming_with_logging():
     """
@@ -251,18 +288,15 @@ async def test_anthropic_messages_litellm_router_non_streaming_with_logging():
                 "model_name": "claude-special-alias",
                 "litellm_params": {
                     "model": "claude-3-haiku-20240307",
-                    "api_key": os.getenv("ANTHROPIC_API_KEY"),
+                    "api_key": _API_KEY,
                 },
             }
         ]
     )
 
-    # Set up test parameters
-    messages = [{"role": "user", "content": "Hello, can you tell me a short joke?"}]
-
     # Call the handler
     response = await router.aanthropic_messages(
-        messages=messages,
+        messages=_joke_messages(),
         model="claude-special-alias",
         max_tokens=100,
     )
@@ -272,8 +306,10 @@ async def test_anthropic_messages_litellm_router_non_streaming_with_logging():
 
     print(f"Non-streaming response: {json.dumps(response, indent=2)}")
 
-    await asyncio.sleep(1)
-    assert test_custom_logger.logged_standard_logging_payload["messages"] == messages
+    await asyncio.wait_for(test_custom_logger.log_received.wait(), timeout=5)
+    assert test_custom_logger.logged_standard_logging_payload["messages"] == [
+        {"role": "user", "content": "Hello, can you tell me a short joke?"}
+    ]
     assert test_custom_logger.logged_standard_logging_payload["response"] is not None
     assert (
         test_custom_logger.logged_standard_logging_payload["model"]
@@ -292,6 +328,7 @@ async def test_anthropic_messages_litellm_router_non_streaming_with_logging():
     )
 
 
+@requires_anthropic_api_key
 @pytest.mark.asyncio
 async def test_anthropic_messages_litellm_router_streaming_with_logging():
     """
@@ -308,18 +345,15 @@ async def test_anthropic_messages_litellm_router_streaming_with_logging():
                 "model_name": "claude-special-alias",
                 "litellm_params": {
                     "model": "claude-3-haiku-20240307",
-                    "api_key": os.getenv("ANTHROPIC_API_KEY"),
+                    "api_key": _API_KEY,
                 },
             }
         ]
     )
 
-    # Set up test parameters
-    messages = [{"role": "user", "content": "Hello, can you tell me a short joke?"}]
-
     # Call the handler
     response = await router.aanthropic_messages(
-        messages=messages,
+        messages=_joke_messages(),
         model="claude-special-alias",
         max_tokens=100,
         stream=True,
@@ -330,52 +364,12 @@ async def test_anthropic_messages_litellm_router_streaming_with_logging():
     all_anthropic_usage_chunks = []
 
     async for chunk in response:
-        # Decode chunk if it's bytes
         print("chunk=", chunk)
 
-        # Handle SSE format chunks
-        if isinstance(chunk, bytes):
-            chunk_str = chunk.decode("utf-8")
-            # Extract the JSON data part from SSE format
-            for line in chunk_str.split("\n"):
-                if line.startswith("data: "):
-                    try:
-                        json_data = json.loads(line[6:])  # Skip the 'data: ' prefix
-                        print(
-                            "\n\nJSON data:",
-                            json.dumps(json_data, indent=4, default=str),
-                        )
-
-                        # Extract usage information
-                        if (
-                            json_data.get("type") == "message_start"
-                            and "message" in json_data
-                        ):
-                            if "usage" in json_data["message"]:
-                                usage = json_data["message"]["usage"]
-                                all_anthropic_usage_chunks.append(usage)
-                                print(
-                                    "USAGE BLOCK",
-                                    json.dumps(usage, indent=4, default=str),
-                                )
-                        elif "usage" in json_data:
-                            usage = json_data["usage"]
-                            all_anthropic_usage_chunks.append(usage)
-                            print(
-                                "USAGE BLOCK", json.dumps(usage, indent=4, default=str)
-                            )
-                    except json.JSONDecodeError:
-                        print(f"Failed to parse JSON from: {line[6:]}")
-        elif hasattr(chunk, "message"):
-            if chunk.message.usage:
-                print(
-                    "USAGE BLOCK",
-                    json.dumps(chunk.message.usage, indent=4, default=str),
-                )
-                all_anthropic_usage_chunks.append(chunk.message.usage)
-        elif hasattr(chunk, "usage"):
-            print("USAGE BLOCK", json.dumps(chunk.usage, indent=4, default=str))
-            all_anthropic_usage_chunks.append(chunk.usage)
+        extractor = _USAGE_EXTRACTORS.get(type(chunk), _usage_from_chunk_attrs)
+        for usage in extractor(chunk):
+            print("USAGE BLOCK", json.dumps(usage, indent=4, default=str))
+            all_anthropic_usage_chunks.append(usage)
 
     print(
         "all_anthropic_usage_chunks",
@@ -394,7 +388,9 @@ async def test_anthropic_messages_litellm_router_streaming_with_logging():
     print("input_tokens_anthropic_api", response_prompt_tokens)
     print("output_tokens_anthropic_api", response_completion_tokens)
 
-    await asyncio.sleep(4)
+    # the streaming success callback only fires once the stream is exhausted, so
+    # the first payload received is the final one
+    await asyncio.wait_for(test_custom_logger.log_received.wait(), timeout=5)
 
     print(
         "logged_standard_logging_payload",
@@ -403,7 +399,9 @@ async def test_anthropic_messages_litellm_router_streaming_with_logging():
         ),
     )
 
-    assert test_custom_logger.logged_standard_logging_payload["messages"] == messages
+    assert test_custom_logger.logged_standard_logging_payload["messages"] == [
+        {"role": "user", "content": "Hello, can you tell me a short joke?"}
+    ]
     assert test_custom_logger.logged_standard_logging_payload["response"] is not None
     assert (
         test_custom_logger.logged_standard_logging_payload["model"]
@@ -427,11 +425,9 @@ async def test_anthropic_messages_with_extra_headers():
     """
     Test the anthropic_messages with extra headers
     """
-    # Get API key from environment
-    api_key = os.getenv("ANTHROPIC_API_KEY", "fake-api-key")
+    api_key = _API_KEY or "fake-api-key"
 
     # Set up test parameters
-    messages = [{"role": "user", "content": "Hello, can you tell me a short joke?"}]
     extra_headers = {
         "anthropic-beta": "very-custom-beta-value",
         "anthropic-version": "custom-version-for-test",
@@ -461,7 +457,7 @@ async def test_anthropic_messages_with_extra_headers():
 
     # Call the handler with extra_headers and our mocked client
     response = await litellm.anthropic.messages.acreate(
-        messages=messages,
+        messages=_joke_messages(),
         api_key=api_key,
         model="claude-3-haiku-20240307",
         max_tokens=100,
@@ -487,3 +483,45 @@ async def test_anthropic_messages_with_extra_headers():
     assert response == mock_response.json.return_value
 
     return response
+
+
+@pytest.mark.asyncio
+async def test_anthropic_messages_router_forwards_client():
+    """
+    Test the router passes `client` through to anthropic_messages instead of dropping it
+    """
+    mock_response = MagicMock()
+    mock_response.raise_for_status = MagicMock()
+    mock_response.json.return_value = {
+        "id": "msg_123456",
+        "type": "message",
+        "role": "assistant",
+        "content": [{"type": "text", "text": "Hi!"}],
+        "model": "claude-3-haiku-20240307",
+        "stop_reason": "end_turn",
+        "usage": {"input_tokens": 10, "output_tokens": 20},
+    }
+
+    mock_client = MagicMock(spec=AsyncHTTPHandler)
+    mock_client.post = AsyncMock(return_value=mock_response)
+
+    router = Router(
+        model_list=[
+            {
+                "model_name": "claude-special-alias",
+                "litellm_params": {
+                    "model": "claude-3-haiku-20240307",
+                    "api_key": "fake-api-key",
+                },
+            }
+        ]
+    )
+    response = await router.aanthropic_messages(
+        messages=_joke_messages(),
+        model="claude-special-alias",
+        max_tokens=100,
+        client=mock_client,
+    )
+
+    mock_client.post.assert_awaited_once()
+    assert response == mock_response.json.return_value
@@ -134,6 +134,40 @@ class TestPassthroughEndpointRouter(unittest.TestCase):
             "COHERE_API_KEY",
         )
 
+    def test_get_credential_name_for_provider(self):
+        self.assertEqual(
+            self.router._get_credential_name_for_provider("assemblyai", "eu"),
+            "ASSEMBLYAI_EU_API_KEY",
+        )
+        self.assertEqual(
+            self.router._get_credential_name_for_provider("assemblyai", None),
+            "ASSEMBLYAI_API_KEY",
+        )
+        # cached - repeat calls return the same string object
+        self.assertIs(
+            self.router._get_credential_name_for_provider("assemblyai", "eu"),
+            self.router._get_credential_name_for_provider("assemblyai", "eu"),
+        )
+
+    def test_get_region_name_from_api_base(self):
+        self.assertEqual(
+            self.router._get_region_name_from_api_base(
+                custom_llm_provider="assemblyai",
+                api_base="https://api.eu.assemblyai.com",
+            ),
+            "eu",
+        )
+        for custom_llm_provider, api_base in [
+            ("assemblyai", "https://api.assemblyai.com"),
+            ("assemblyai", None),
+            ("openai", "https://eu.openai.example.com"),
+        ]:
+            self.assertIsNone(
+                self.router._get_region_name_from_api_base(
+                    custom_llm_provider=custom_llm_provider, api_base=api_base
+                )
+            )
+
     def test_get_deployment_key(self):
         """Test _get_deployment_key with various inputs"""
         router = PassthroughEndpointRouter()